@@ -1,49 +1,70 @@
 import feedparser
-import sqlite3
-
-# RSS feed URL
-rss_url = "https://news.mit.edu/topic/mitquantum-computing-rss.xml"
-
-# Parse the feed
-feed = feedparser.parse(rss_url)
-
-# Connect to SQLite database (or create it)
-conn = sqlite3.connect("quantum_news_rss.db")
-cursor = conn.cursor()
-
-# Create table if it doesn't exist
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS articles (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    title TEXT,
-    published TEXT,
-    author TEXT,
-    link TEXT UNIQUE,
-    summary TEXT
-)
-""")
-
-# Insert entries into the database
-if feed.bozo:
-    print("Failed to parse RSS feed.")
-else:
-    for entry in feed.entries[:5]:  # Limit to 10 entries
-        title = entry.get("title", "No Title")
-        published = entry.get("published", "No Date")
-        author = entry.get("author", "Unknown Author")
-        link = entry.get("link", "")
-        summary = entry.get("summary", "No Summary")
+from concurrent.futures import ThreadPoolExecutor
 
+from db import get_pool
+
+# RSS feed URLs - add more quantum news sources here
+RSS_URLS = [
+    "https://news.mit.edu/topic/mitquantum-computing-rss.xml",
+]
+
+# Feed fetching is network-bound, so parse all feeds in parallel
+with ThreadPoolExecutor(max_workers=4) as executor:
+    feeds = list(executor.map(feedparser.parse, RSS_URLS))
+
+# Merge entries from all feeds, skipping any that failed to parse
+entries = []
+for feed in feeds:
+    if feed.bozo:
+        print("Failed to parse RSS feed.")
+    else:
+        entries.extend(feed.entries[:5])  # Limit to 5 entries per feed
+
+# All DB work goes through the shared pool's single write connection
+pool = get_pool("quantum_news_rss.db")
+
+with pool.write() as conn:
+    cursor = conn.cursor()
+
+    # Create table if it doesn't exist
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT,
+        published TEXT,
+        author TEXT,
+        link TEXT UNIQUE,
+        summary TEXT
+    )
+    """)
+
+    # Index for the reader's ORDER BY published DESC, avoiding a full
+    # scan + sort once the table grows
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published DESC)")
+
+    # Insert entries into the database
+    if entries:
+        rows = [
+            (
+                entry.get("title", "No Title"),
+                entry.get("published", "No Date"),
+                entry.get("author", "Unknown Author"),
+                entry.get("link", ""),
+                entry.get("summary", "No Summary"),
+            )
+            for entry in entries
+        ]
+
+        # One executemany inside a single transaction instead of a commit per
+        # row, so SQLite fsyncs once for the whole batch
         try:
-            cursor.execute("""
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany("""
             INSERT OR IGNORE INTO articles (title, published, author, link, summary)
             VALUES (?, ?, ?, ?, ?)
-            """, (title, published, author, link, summary))
+            """, rows)
+            conn.commit()
+            print("Articles saved to database.")
         except Exception as e:
-            print(f"Error inserting article: {e}")
-
-    conn.commit()
-    print("Articles saved to database.")
-
-# Close connection
-conn.close()
+            conn.rollback()
+            print(f"Error inserting articles: {e}")
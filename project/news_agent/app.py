@@ -1,14 +1,14 @@
 from flask import Flask, render_template, jsonify
-import sqlite3
+
+from db import get_pool
 
 app = Flask(__name__)
 
 def get_news():
-    conn = sqlite3.connect("quantum_news.db")
-    cursor = conn.cursor()
-    cursor.execute("SELECT title, url, summary, date FROM news ORDER BY date DESC")
-    news = cursor.fetchall()
-    conn.close()
+    with get_pool("quantum_news.db").read() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT title, url, summary, date FROM news ORDER BY date DESC")
+        news = cursor.fetchall()
     return news
 
 @app.route("/")
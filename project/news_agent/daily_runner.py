@@ -14,6 +14,7 @@ import os
 from datetime import datetime
 from enhanced_agent import QuantumNewsAgent
 from enhanced_rss_parser import QuantumRSSParser
+from db import get_pool
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +30,9 @@ class DailyNewsProcessor:
     def __init__(self):
         self.agent = QuantumNewsAgent()
         self.parser = QuantumRSSParser()
+        # Resolve the pool once; its connections are long-lived with
+        # PRAGMAs pre-applied, so repeated stats calls do no setup work
+        self._db_pool = get_pool(self.parser.db_path)
         self.start_time = datetime.now()
 
     async def run_daily_process(self):
@@ -38,9 +42,23 @@ class DailyNewsProcessor:
         logging.info("=" * 60)
 
         try:
-            # Step 1: Process new articles
-            logging.info("Step 1: Processing new articles from RSS feed...")
-            new_article_result = await self.agent.process_new_articles()
+            # Steps 1+2 run concurrently: they touch disjoint DB rows and
+            # independent LLM sessions, so the RSS fetch + new-article call
+            # overlaps with the backlog fan-out (whose concurrency is already
+            # bounded by the agent's semaphore).
+            logging.info("Steps 1+2: Processing new articles and backlog concurrently...")
+            new_article_result, backlog_result = await asyncio.gather(
+                self.agent.process_new_articles(),
+                self.agent.process_existing_articles_without_summary(),
+                return_exceptions=True
+            )
+
+            if isinstance(new_article_result, Exception):
+                logging.error(f"❌ New article processing raised: {new_article_result}")
+                new_article_result = {'status': 'error', 'message': str(new_article_result)}
+            if isinstance(backlog_result, Exception):
+                logging.error(f"❌ Backlog processing raised: {backlog_result}")
+                backlog_result = {'processed_count': 0, 'error': str(backlog_result)}
 
             if new_article_result['status'] == 'success':
                 logging.info(f"✅ New article processed: {new_article_result['article']['title']}")
@@ -50,10 +68,6 @@ class DailyNewsProcessor:
             else:
                 logging.error(f"❌ Failed to process new articles: {new_article_result.get('message', 'Unknown error')}")
 
-            # Step 2: Process any existing articles without summaries
-            logging.info("Step 2: Processing existing articles without summaries...")
-            backlog_result = await self.agent.process_existing_articles_without_summary()
-
             if 'error' in backlog_result:
                 logging.error(f"❌ Error processing backlog: {backlog_result['error']}")
             else:
@@ -97,6 +111,13 @@ class DailyNewsProcessor:
                 'duration': str(datetime.now() - self.start_time)
             }
 
+        finally:
+            # Close the shared aiosqlite connections; their non-daemon
+            # worker threads otherwise keep the process alive after the
+            # run finishes
+            await self.agent.rss_parser.aclose()
+            await self.parser.aclose()
+
     async def generate_daily_summary(self, new_article_result, backlog_result, duration):
         """Generate a human-readable summary of the daily processing"""
         summary_parts = []
@@ -110,6 +131,8 @@ class DailyNewsProcessor:
             summary_parts.append(f"   Publish Date: {article['publish_date']}")
             summary_parts.append(f"   Link: {article['link']}")
             summary_parts.append(f"   AI Summary Generated: ✅ ({len(new_article_result['summary'])} chars)")
+            if new_article_result.get('tags'):
+                summary_parts.append(f"   Tags: {', '.join(new_article_result['tags'])}")
         elif new_article_result['status'] == 'no_new_articles':
             summary_parts.append("🔄 NO NEW ARTICLES: RSS feed had no new articles to process")
         else:
@@ -135,22 +158,23 @@ class DailyNewsProcessor:
     def get_database_stats(self):
         """Get current database statistics"""
         try:
-            conn = sqlite3.connect(self.parser.db_path)
-            cursor = conn.cursor()
-
-            # Get various statistics
-            stats = {}
-            cursor.execute("SELECT COUNT(*) FROM quantum_news_rss")
-            stats['total_articles'] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM quantum_news_rss WHERE ai_summary IS NOT NULL AND ai_summary != ''")
-            stats['summarized'] = cursor.fetchone()[0]
-
-            cursor.execute("SELECT COUNT(*) FROM quantum_news_rss WHERE ai_summary IS NULL OR ai_summary = ''")
-            stats['pending'] = cursor.fetchone()[0]
-
-            conn.close()
-            return stats
+            with self._db_pool.read() as conn:
+                cursor = conn.cursor()
+
+                # One aggregate scan instead of three COUNT(*) passes
+                cursor.execute("""
+                    SELECT COUNT(*),
+                           SUM(CASE WHEN ai_summary IS NOT NULL AND ai_summary != '' THEN 1 ELSE 0 END)
+                    FROM quantum_news_rss
+                """)
+                total, summarized = cursor.fetchone()
+
+            summarized = summarized or 0
+            return {
+                'total_articles': total,
+                'summarized': summarized,
+                'pending': total - summarized
+            }
         except Exception as e:
             logging.error(f"Error getting database stats: {e}")
             return None
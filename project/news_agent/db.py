@@ -0,0 +1,76 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# PRAGMAs applied to every connection. WAL lets the Flask readers query
+# concurrently with the RSS writer, synchronous=NORMAL drops the full
+# fsync per commit, and the busy timeout keeps writers from failing with
+# SQLITE_BUSY while another transaction holds the lock.
+PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=memory",
+    # Serve reads via mmap (zero-copy from page cache) up to 256 MB
+    "PRAGMA mmap_size=268435456",
+]
+
+def connect(db_path):
+    """Open a SQLite connection with the tuned PRAGMAs applied.
+
+    isolation_level=None leaves transaction control to the caller; write
+    paths should use explicit BEGIN IMMEDIATE ... COMMIT blocks.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    # Row supports both index and name access, so tuple-style callers keep
+    # working while list endpoints get dict(row) without per-column copies
+    conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+class SqlitePool:
+    """Long-lived connection pool: one serialized writer + N readers.
+
+    WAL mode lets readers run concurrently with the single writer, so the
+    pool keeps N read connections in a queue and guards one write
+    connection with a lock. PRAGMAs are applied once at connection
+    creation, not per checkout.
+    """
+
+    def __init__(self, db_path, readers=None):
+        self.db_path = db_path
+        self._readers = queue.Queue()
+        for _ in range(readers or max(os.cpu_count() or 1, 4)):
+            self._readers.put(connect(db_path))
+        self._write_conn = connect(db_path)
+        self._write_lock = threading.Lock()
+
+    @contextmanager
+    def read(self):
+        """Check out a read connection"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def write(self):
+        """Acquire the single write connection"""
+        with self._write_lock:
+            yield self._write_conn
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path):
+    """Get (or lazily create) the shared pool for a database path"""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = SqlitePool(db_path)
+        return pool
@@ -1,5 +1,9 @@
 import os
 import asyncio
+import hashlib
+import json
+import random
+import re
 from dotenv import load_dotenv
 from google.genai import types
 from google.adk.agents.llm_agent import LlmAgent
@@ -14,6 +18,98 @@ load_dotenv()
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+def content_hash(content):
+    """SHA-256 of whitespace-normalized, lowercased content"""
+    normalized = re.sub(r"\s+", " ", content).strip().lower()
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+# Static prompt skeletons hoisted to module level; each call does a
+# single .replace substitution instead of rebuilding a multi-KB f-string,
+# which matters with 10+ requests in flight on the event loop thread.
+SUMMARY_PROMPT_TEMPLATE = """
+Please summarize the following quantum computing article in exactly 250 words.
+Make the summary engaging and accessible to general readers while preserving the key technical concepts.
+Use plain English and avoid jargon where possible.
+
+Article content:
+{{CONTENT}}
+"""
+
+BATCH_PROMPT_TEMPLATE = """
+You are given {{COUNT}} quantum computing articles, each marked with [ARTICLE id=...].
+For each article, write a 250-word summary that is engaging and accessible to general readers
+while preserving the key technical concepts. Use plain English and avoid jargon where possible.
+
+Return ONLY a JSON array, with one object per article in the form:
+[{"id": <article id>, "summary": "<250-word summary>"}, ...]
+
+{{ARTICLES}}
+"""
+
+def strip_json_fences(text):
+    """Strip the markdown code fences models often wrap JSON in"""
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+        if cleaned.startswith("json"):
+            cleaned = cleaned[4:]
+    return cleaned
+
+# Retries for transient Gemini failures (429s/5xx under concurrent fan-out)
+MAX_LLM_RETRIES = 5
+
+class AsyncRateLimiter:
+    """Paces requests to a queries-per-minute budget
+
+    The semaphore bounds how many requests are in flight but not how fast
+    they start; hitting the Gemini QPM cap triggers backoff storms. This
+    limiter hands out evenly spaced start slots so the fan-out rides just
+    under the rate limit.
+    """
+
+    def __init__(self, qpm):
+        self.interval = 60.0 / qpm
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def acquire(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+STRUCTURED_PROMPT_TEMPLATE = """
+Summarize the following quantum computing article. The summary must be exactly 250 words,
+engaging and accessible to general readers while preserving the key technical concepts,
+in plain English with jargon avoided where possible.
+
+Return ONLY a JSON object of the form:
+{"summary": "<250-word summary>", "tags": ["<topic tag>", ...], "difficulty": "<beginner|intermediate|advanced>"}
+
+Article content:
+{{CONTENT}}
+"""
+
+# Token-aware truncation cap. ~4 chars per token is a good heuristic for
+# English prose and avoids pulling in a tokenizer dependency.
+MAX_CONTENT_TOKENS = 3000
+CHARS_PER_TOKEN = 4
+
+def truncate_content(content):
+    """Cap content at roughly MAX_CONTENT_TOKENS before prompt construction
+
+    Truncating up front keeps the oversized text out of the prompt
+    f-string entirely, so we never build (or send) a payload the model
+    would truncate anyway.
+    """
+    cap = MAX_CONTENT_TOKENS * CHARS_PER_TOKEN
+    if len(content) > cap:
+        logging.info("Content truncated due to length")
+        return content[:cap] + "..."
+    return content
+
 class QuantumNewsAgent:
     def __init__(self, google_api_key=None):
         # Load API key from parameter, environment variable, or .env file
@@ -24,77 +120,240 @@ class QuantumNewsAgent:
 
         self.rss_parser = QuantumRSSParser()
 
+        # Shared by all concurrent tasks so total request rate stays under
+        # the Gemini QPM tier
+        self._limiter = AsyncRateLimiter(qpm=int(os.getenv("GEMINI_QPM", "500")))
+
+        # Build the ADK session service, agents, and runners once; they
+        # pre-configure model clients, so per-call reconstruction is pure
+        # overhead under the concurrent backlog workload. Each call only
+        # does create_session + run_async.
+        self._session_service = InMemorySessionService()
+        self._summary_agent = LlmAgent(
+            model='gemini-2.0-flash',
+            name='quantum_news_summarizer',
+            instruction='You are an expert science communicator specializing in quantum computing. Create engaging, accessible 250-word summaries that make complex quantum concepts understandable to general audiences.',
+        )
+        self._summary_runner = Runner(
+            app_name='quantum_news_app',
+            agent=self._summary_agent,
+            session_service=self._session_service,
+        )
+        self._batch_agent = LlmAgent(
+            model='gemini-2.0-flash',
+            name='quantum_news_batch_summarizer',
+            instruction='You are an expert science communicator specializing in quantum computing. Create engaging, accessible 250-word summaries and return them strictly as a JSON array.',
+        )
+        self._batch_runner = Runner(
+            app_name='quantum_news_app',
+            agent=self._batch_agent,
+            session_service=self._session_service,
+        )
+        self._structured_agent = LlmAgent(
+            model='gemini-2.0-flash',
+            name='quantum_news_structured_summarizer',
+            instruction='You are an expert science communicator specializing in quantum computing. Return strictly a JSON object with an engaging, accessible 250-word summary, topic tags, and a difficulty rating.',
+        )
+        self._structured_runner = Runner(
+            app_name='quantum_news_app',
+            agent=self._structured_agent,
+            session_service=self._session_service,
+        )
+
+    async def _run_llm_with_retry(self, runner, session, content_obj):
+        """Run an agent and return the final response text
+
+        Transient failures (rate limits, 5xx) are retried with jittered
+        exponential backoff instead of dropping the article, so a burst of
+        429s under fan-out no longer forces reprocessing on the next run.
+        Returning from inside the async for acloses the underlying
+        generator, releasing the HTTP stream immediately instead of
+        letting it drain.
+        """
+        for attempt in range(MAX_LLM_RETRIES):
+            try:
+                await self._limiter.acquire()
+                async for event in runner.run_async(
+                    session_id=session.id,
+                    user_id=session.user_id,
+                    new_message=content_obj
+                ):
+                    if not event.is_final_response():
+                        continue
+                    if event.content and event.content.parts:
+                        return event.content.parts[0].text
+                    if event.actions and event.actions.escalate:
+                        logging.error(f"Agent escalated: {event.error_message or 'No specific message.'}")
+                    return None
+                return None
+            except Exception as e:
+                if attempt == MAX_LLM_RETRIES - 1:
+                    raise
+                delay = min(30, (2 ** attempt) + random.random())
+                logging.warning(f"LLM call failed (attempt {attempt + 1}/{MAX_LLM_RETRIES}): {e}; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
     async def summarize_article_content(self, content):
         """Generate AI summary for article content"""
         try:
-            session_service = InMemorySessionService()
-            session = await session_service.create_session(
+            # Republished/near-duplicate articles are common across feeds;
+            # skip the LLM call when identical content was already summarized
+            cache_key = content_hash(content)
+            cached = self.rss_parser.get_cached_summary(cache_key)
+            if cached:
+                logging.info("Summary cache hit, skipping LLM call")
+                return cached
+
+            session = await self._session_service.create_session(
                 state={}, app_name='quantum_news_app', user_id='user_fs'
             )
 
             # Truncate content if too long (to avoid token limits)
-            max_content_length = 8000
-            if len(content) > max_content_length:
-                content = content[:max_content_length] + "..."
-                logging.info("Content truncated due to length")
+            content = truncate_content(content)
 
-            prompt = f"""
-            Please summarize the following quantum computing article in exactly 250 words.
-            Make the summary engaging and accessible to general readers while preserving the key technical concepts.
-            Use plain English and avoid jargon where possible.
-
-            Article content:
-            {content}
-            """
+            prompt = SUMMARY_PROMPT_TEMPLATE.replace("{{CONTENT}}", content)
 
             content_obj = types.Content(role='user', parts=[types.Part(text=prompt)])
 
-            root_agent = LlmAgent(
-                model='gemini-2.0-flash',
-                name='quantum_news_summarizer',
-                instruction='You are an expert science communicator specializing in quantum computing. Create engaging, accessible 250-word summaries that make complex quantum concepts understandable to general audiences.',
+            logging.info("Generating AI summary...")
+
+            summary = await self._run_llm_with_retry(self._summary_runner, session, content_obj)
+            if summary:
+                logging.info("Summary generated successfully")
+                self.rss_parser.cache_summary(cache_key, summary)
+                return summary
+
+            return None
+
+        except Exception as e:
+            logging.error(f"Error generating summary: {e}")
+            return None
+
+    async def summarize_articles_batch(self, articles):
+        """Generate AI summaries for several articles in a single LLM call
+
+        Packing multiple articles into one prompt cuts the request count
+        (and rate-limit pressure) by the batch size during backlog processing.
+
+        Args:
+            articles: List of (article_id, content) tuples
+
+        Returns:
+            Dict mapping article_id to its summary (missing ids failed)
+        """
+        try:
+            # Serve cache hits up front and only send uncached articles
+            summaries = {}
+            cache_keys = {}
+            uncached = []
+            for article_id, content in articles:
+                cache_keys[article_id] = content_hash(content)
+                cached = self.rss_parser.get_cached_summary(cache_keys[article_id])
+                if cached:
+                    summaries[article_id] = cached
+                else:
+                    uncached.append((article_id, content))
+
+            if not uncached:
+                logging.info(f"All {len(articles)} articles in batch served from summary cache")
+                return summaries
+
+            session = await self._session_service.create_session(
+                state={}, app_name='quantum_news_app', user_id='user_fs'
             )
 
-            runner = Runner(
-                app_name='quantum_news_app',
-                agent=root_agent,
-                session_service=session_service,
+            sections = [
+                f"[ARTICLE id={article_id}]\n{truncate_content(content)}"
+                for article_id, content in uncached
+            ]
+
+            prompt = (
+                BATCH_PROMPT_TEMPLATE
+                .replace("{{COUNT}}", str(len(uncached)))
+                .replace("{{ARTICLES}}", "\n".join(sections))
             )
 
-            logging.info("Generating AI summary...")
+            content_obj = types.Content(role='user', parts=[types.Part(text=prompt)])
 
-            async for event in runner.run_async(
-                session_id=session.id,
-                user_id=session.user_id,
-                new_message=content_obj
-            ):
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        summary = event.content.parts[0].text
-                        logging.info("Summary generated successfully")
-                        return summary
-                    elif event.actions and event.actions.escalate:
-                        error_msg = f"Agent escalated: {event.error_message or 'No specific message.'}"
-                        logging.error(error_msg)
-                        return None
+            logging.info(f"Generating AI summaries for batch of {len(uncached)} articles...")
 
-            return None
+            response_text = await self._run_llm_with_retry(self._batch_runner, session, content_obj)
+
+            if not response_text:
+                return summaries
+
+            for item in json.loads(strip_json_fences(response_text)):
+                # Coerce the id per item: the model often returns it as a
+                # string, and one malformed element shouldn't discard the
+                # rest of the parsed batch
+                try:
+                    item_id = int(item['id'])
+                    summary = item.get('summary')
+                except (KeyError, TypeError, ValueError):
+                    logging.warning(f"Skipping malformed batch item: {item!r}")
+                    continue
+                if summary:
+                    summaries[item_id] = summary
+                    if item_id in cache_keys:
+                        self.rss_parser.cache_summary(cache_keys[item_id], summary)
+
+            logging.info(f"Batch summaries generated for {len(summaries)}/{len(articles)} articles")
+            return summaries
 
         except Exception as e:
-            logging.error(f"Error generating summary: {e}")
+            logging.error(f"Error generating batch summaries: {e}")
+            return {}
+
+    async def summarize_article_structured(self, content):
+        """Generate summary, topic tags, and difficulty in one structured call
+
+        One JSON-returning call covers every field downstream consumers
+        need, instead of a second model call per future feature (tagging,
+        classification) plus re-parsing of prose output.
+
+        Returns:
+            Dict with 'summary', 'tags', and 'difficulty' keys, or None
+        """
+        try:
+            session = await self._session_service.create_session(
+                state={}, app_name='quantum_news_app', user_id='user_fs'
+            )
+
+            prompt = STRUCTURED_PROMPT_TEMPLATE.replace("{{CONTENT}}", truncate_content(content))
+            content_obj = types.Content(role='user', parts=[types.Part(text=prompt)])
+
+            logging.info("Generating structured AI summary...")
+
+            response_text = await self._run_llm_with_retry(self._structured_runner, session, content_obj)
+            if not response_text:
+                return None
+
+            result = json.loads(strip_json_fences(response_text))
+            if not result.get('summary'):
+                logging.error("Structured response missing summary field")
+                return None
+
+            logging.info("Structured summary generated successfully")
+            return result
+
+        except Exception as e:
+            logging.error(f"Error generating structured summary: {e}")
             return None
 
     async def process_new_articles(self):
         """Process new articles and generate summaries"""
         try:
-            # Fetch latest article from RSS
-            new_article = self.rss_parser.fetch_latest_article()
+            # Fetch latest article from RSS. feedparser blocks on HTTP, so
+            # run it in a worker thread to keep the event loop (and any
+            # concurrent backlog tasks) moving during the network wait.
+            new_article = await asyncio.to_thread(self.rss_parser.fetch_latest_article)
 
             if new_article:
                 logging.info(f"Processing new article: {new_article['title']}")
 
-                # Generate AI summary
-                summary = await self.summarize_article_content(new_article['content'])
+                # Generate AI summary plus tags/difficulty in one call
+                structured = await self.summarize_article_structured(new_article['content'])
+                summary = structured['summary'] if structured else None
 
                 if summary:
                     # Update article with summary
@@ -104,6 +363,8 @@ class QuantumNewsAgent:
                         return {
                             'article': new_article,
                             'summary': summary,
+                            'tags': structured.get('tags', []),
+                            'difficulty': structured.get('difficulty'),
                             'status': 'success'
                         }
                     else:
@@ -120,26 +381,50 @@ class QuantumNewsAgent:
             logging.error(f"Error processing articles: {e}")
             return {'status': 'error', 'message': str(e)}
 
-    async def process_existing_articles_without_summary(self):
+    async def process_existing_articles_without_summary(self, batch_size=4):
         """Process existing articles that don't have summaries"""
         try:
-            articles = self.rss_parser.get_articles_without_summary()
-            processed_count = 0
+            articles = await self.rss_parser.aget_articles_without_summary()
 
-            for article_id, title, content, link in articles:
-                logging.info(f"Processing existing article: {title}")
+            # Pack batch_size articles per LLM call and fan the batches out
+            # concurrently. The semaphore bounds in-flight Gemini requests so
+            # we stay under the API rate limit.
+            semaphore = asyncio.Semaphore(int(os.getenv("GEMINI_CONCURRENCY", "10")))
+            batches = [articles[i:i + batch_size] for i in range(0, len(articles), batch_size)]
 
-                summary = await self.summarize_article_content(content)
+            async def process_batch(batch):
+                async with semaphore:
+                    summaries = await self.summarize_articles_batch(
+                        [(article_id, content) for article_id, title, content, link in batch]
+                    )
 
-                if summary:
-                    success = self.rss_parser.update_article_summary(article_id, summary)
-                    if success:
-                        processed_count += 1
+                pairs = []
+                for article_id, title, content, link in batch:
+                    summary = summaries.get(article_id)
+                    if summary:
+                        pairs.append((summary, article_id))
                         logging.info(f"Summary generated for: {title}")
                     else:
-                        logging.error(f"Failed to save summary for: {title}")
+                        logging.error(f"Failed to generate summary for: {title}")
+
+                # One transaction per batch instead of a commit per article
+                if pairs:
+                    if await self.rss_parser.aupdate_many_summaries(pairs):
+                        return len(pairs)
+                    logging.error(f"Failed to save summaries for batch of {len(pairs)} articles")
+                return 0
+
+            results = await asyncio.gather(
+                *[process_batch(batch) for batch in batches],
+                return_exceptions=True
+            )
+
+            processed_count = 0
+            for batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logging.error(f"Error processing batch of {len(batch)} articles: {result}")
                 else:
-                    logging.error(f"Failed to generate summary for: {title}")
+                    processed_count += result
 
             return {'processed_count': processed_count, 'total_articles': len(articles)}
 
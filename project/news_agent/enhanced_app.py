@@ -1,6 +1,12 @@
-from flask import Flask, render_template, jsonify
-import sqlite3
+from flask import Flask, render_template, jsonify, request, Response
+import hashlib
 import logging
+import time
+from functools import lru_cache
+
+import orjson
+
+from db import get_pool
 import sys
 import os
 from pathlib import Path
@@ -11,7 +17,8 @@ ontology_path = Path(__file__).parent.parent / "ontology"
 sys.path.append(str(ontology_path))
 
 try:
-    from rdflib import Graph, Namespace
+    from rdflib import Graph, Namespace, Literal
+    from rdflib.plugins.sparql import prepareQuery
     from quantum_supply_chain_ontology import QuantumSupplyChainOntology
     ONTOLOGY_AVAILABLE = True
 except ImportError:
@@ -24,62 +31,59 @@ app = Flask(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 class QuantumNewsDB:
+    # Constant SQL text so SQLite's per-connection statement cache keeps
+    # hitting the same prepared plan across requests
+    ARTICLES_SQL = """
+        SELECT id, title, author, publish_date, article_link, ai_summary, created_at
+        FROM quantum_news_rss
+        WHERE ai_summary IS NOT NULL AND ai_summary != ''
+        ORDER BY created_at DESC
+        LIMIT ?
+    """
+
     def __init__(self, db_path="quantum_news_rss.db"):
         self.db_path = db_path
+        # Long-lived pooled connections (WAL + PRAGMAs applied once at
+        # creation) instead of an open/close pair per request
+        self._pool = get_pool(db_path)
 
     def get_all_articles(self, limit=20):
         """Get all articles with summaries, ordered by most recent"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, title, author, publish_date, article_link, ai_summary, created_at
-            FROM quantum_news_rss
-            WHERE ai_summary IS NOT NULL AND ai_summary != ''
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,))
+        with self._pool.read() as conn:
+            cursor = conn.execute(self.ARTICLES_SQL, (limit,))
+            articles = cursor.fetchall()
 
-        articles = cursor.fetchall()
-        conn.close()
-
-        # Format articles as dictionaries
+        # Pooled connections return sqlite3.Row, so each article converts
+        # straight to a dict instead of a hand-built 7-key copy; only the
+        # renamed/defaulted fields are touched individually
         formatted_articles = []
         for article in articles:
-            formatted_articles.append({
-                'id': article[0],
-                'title': article[1],
-                'author': article[2] or 'Unknown Author',
-                'publish_date': article[3],
-                'link': article[4],
-                'summary': article[5],
-                'created_at': article[6]
-            })
+            row = dict(article)
+            row['author'] = row['author'] or 'Unknown Author'
+            row['link'] = row.pop('article_link')
+            row['summary'] = row.pop('ai_summary')
+            formatted_articles.append(row)
 
         return formatted_articles
 
     def get_article_stats(self):
         """Get statistics about articles"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Total articles
-        cursor.execute("SELECT COUNT(*) FROM quantum_news_rss")
-        total_articles = cursor.fetchone()[0]
-
-        # Articles with summaries
-        cursor.execute("SELECT COUNT(*) FROM quantum_news_rss WHERE ai_summary IS NOT NULL AND ai_summary != ''")
-        articles_with_summary = cursor.fetchone()[0]
-
-        # Articles without summaries
+        with self._pool.read() as conn:
+            cursor = conn.cursor()
+
+            # One aggregate query: a single table scan instead of three
+            # round-trips
+            cursor.execute("""
+                SELECT COUNT(*),
+                       SUM(CASE WHEN ai_summary IS NOT NULL AND ai_summary != '' THEN 1 ELSE 0 END),
+                       MAX(created_at)
+                FROM quantum_news_rss
+            """)
+            total_articles, articles_with_summary, last_updated = cursor.fetchone()
+
+        articles_with_summary = articles_with_summary or 0
         articles_without_summary = total_articles - articles_with_summary
 
-        # Most recent article date
-        cursor.execute("SELECT MAX(created_at) FROM quantum_news_rss")
-        last_updated = cursor.fetchone()[0]
-
-        conn.close()
-
         return {
             'total_articles': total_articles,
             'articles_with_summary': articles_with_summary,
@@ -90,6 +94,12 @@ class QuantumNewsDB:
 class OntologyVisualizer:
     """Handles ontology data for visualization"""
 
+    # Single-pass translation table; runs once per node/edge name instead
+    # of six chained str.replace scans
+    _NAME_TRANS = str.maketrans({
+        ' ': '_', '.': None, ',': None, '(': None, ')': None, '-': '_'
+    })
+
     def __init__(self):
         self.ontology_file = ontology_path / "quantum_supply_chain_ontology.ttl"
 
@@ -97,24 +107,86 @@ class OntologyVisualizer:
         self.graph = None
         self.qsc_namespace = Namespace("http://quantum-supply-chain.org/ontology#")
 
+        # Hot-triple indexes materialized from the graph on load; edge
+        # generation walks these plain dicts instead of the SPARQL engine
+        self._name_by_uri = {}
+        self._clients_of = {}
+        self._supports = {}
+
+        # Fixed-shape queries compiled once; rdflib reuses the parsed
+        # algebra on every call instead of re-parsing the SPARQL text.
+        # (The relationship queries stay f-strings because their VALUES
+        # blocks change with the node set.)
+        self._companies_query = prepareQuery("""
+            SELECT ?company ?type ?name ?country ?website ?notes WHERE {
+                VALUES ?type { qsc:QuantumHardwareCompany qsc:ComponentSupplier qsc:SoftwareCompany }
+                ?company a ?type .
+                ?company qsc:name ?name .
+                OPTIONAL { ?company qsc:country ?country }
+                OPTIONAL { ?company qsc:website ?website }
+                OPTIONAL { ?company qsc:notes ?notes }
+            }
+        """, initNs={'qsc': self.qsc_namespace})
+        self._node_details_query = prepareQuery("""
+            SELECT ?prop ?value WHERE {
+                ?company qsc:name ?name .
+                ?company ?prop ?value .
+            }
+        """, initNs={'qsc': self.qsc_namespace})
+
     def load_ontology(self):
-        """Load the ontology file"""
+        """Load the ontology file, preferring the N-Triples disk cache
+
+        rdflib's Turtle parser is pure Python and dominates the first
+        graph load. After parsing once we serialize to N-Triples, whose
+        line-oriented parser is much faster, and reuse that cache on
+        later loads as long as it is newer than the .ttl source.
+        """
         if not ONTOLOGY_AVAILABLE:
             return False
 
         try:
             self.graph = Graph()
+            cache_file = self.ontology_file.with_suffix(".nt")
+            if (self.ontology_file.exists() and cache_file.exists()
+                    and cache_file.stat().st_mtime >= self.ontology_file.stat().st_mtime):
+                self.graph.parse(str(cache_file), format="nt")
+                self._build_indexes()
+                return True
             if self.ontology_file.exists():
                 self.graph.parse(str(self.ontology_file), format="ttl")
+                try:
+                    self.graph.serialize(destination=str(cache_file), format="nt")
+                except Exception as e:
+                    logging.warning(f"Could not write ontology cache: {e}")
+                self._build_indexes()
                 return True
             return False
         except Exception as e:
             logging.error(f"Error loading ontology: {e}")
             return False
 
+    def _build_indexes(self):
+        """Materialize the hot predicates into native dicts
+
+        The relationship "queries" are just joins on three fixed
+        predicates, so one pass over graph.triples per predicate gives us
+        dict lookups at edge-build time with no SPARQL engine overhead.
+        """
+        qsc = self.qsc_namespace
+        self._name_by_uri = {
+            s: str(o) for s, _, o in self.graph.triples((None, qsc.name, None))
+        }
+        self._clients_of = {}
+        for s, _, o in self.graph.triples((None, qsc.hasClient, None)):
+            self._clients_of.setdefault(s, []).append(o)
+        self._supports = {}
+        for s, _, o in self.graph.triples((None, qsc.supportsHardware, None)):
+            self._supports.setdefault(s, []).append(o)
+
     def normalize_name_for_id(self, name):
         """Convert company name to consistent ID format"""
-        return str(name).replace(' ', '_').replace('.', '').replace(',', '').replace('(', '').replace(')', '').replace('-', '_')
+        return str(name).translate(self._NAME_TRANS)
 
     def get_visualization_data(self):
         """Get data formatted for D3.js visualization"""
@@ -127,8 +199,11 @@ class OntologyVisualizer:
         node_ids = set()
 
         try:
+            # One batched query for all three company types
+            companies_by_type = self.get_all_companies()
+
             # Get hardware companies
-            hw_companies = self.get_companies_by_type("QuantumHardwareCompany")
+            hw_companies = companies_by_type["QuantumHardwareCompany"]
             for company in hw_companies:
                 node_id = f"hw_{self.normalize_name_for_id(company['name'])}"
                 nodes.append({
@@ -141,7 +216,7 @@ class OntologyVisualizer:
                 node_ids.add(node_id)
 
             # Get component suppliers
-            suppliers = self.get_companies_by_type("ComponentSupplier")
+            suppliers = companies_by_type["ComponentSupplier"]
             for supplier in suppliers:
                 node_id = f"sup_{self.normalize_name_for_id(supplier['name'])}"
                 nodes.append({
@@ -154,7 +229,7 @@ class OntologyVisualizer:
                 node_ids.add(node_id)
 
             # Get software companies
-            software = self.get_companies_by_type("SoftwareCompany")
+            software = companies_by_type["SoftwareCompany"]
             for sw in software:
                 node_id = f"sw_{self.normalize_name_for_id(sw['name'])}"
                 nodes.append({
@@ -166,9 +241,14 @@ class OntologyVisualizer:
                 })
                 node_ids.add(node_id)
 
-            # Create links based on relationships, but only for nodes that exist
-            links.extend(self.get_supply_relationships(node_ids))
-            links.extend(self.get_software_relationships(node_ids))
+            # Create links from the materialized triple indexes; the
+            # precomputed name->id maps make per-edge resolution a dict
+            # lookup instead of a fresh normalization
+            supplier_ids = {s['name']: f"sup_{self.normalize_name_for_id(s['name'])}" for s in suppliers}
+            hw_ids = {c['name']: f"hw_{self.normalize_name_for_id(c['name'])}" for c in hw_companies}
+            sw_ids = {s['name']: f"sw_{self.normalize_name_for_id(s['name'])}" for s in software}
+            links.extend(self.get_supply_relationships(supplier_ids, hw_ids))
+            links.extend(self.get_software_relationships(sw_ids, hw_ids))
 
             return {'nodes': nodes, 'links': links}
 
@@ -176,89 +256,79 @@ class OntologyVisualizer:
             logging.error(f"Error generating visualization data: {e}")
             return {'nodes': [], 'links': []}
 
-    def get_companies_by_type(self, company_type):
-        """Get companies of a specific type"""
-        companies = []
-
-        query = f"""
-        PREFIX qsc: <http://quantum-supply-chain.org/ontology#>
-        SELECT ?company ?name ?country ?website ?notes WHERE {{
-            ?company a qsc:{company_type} .
-            ?company qsc:name ?name .
-            OPTIONAL {{ ?company qsc:country ?country }}
-            OPTIONAL {{ ?company qsc:website ?website }}
-            OPTIONAL {{ ?company qsc:notes ?notes }}
-        }}
+    def get_all_companies(self):
+        """Get all company types in one query
+
+        A single SELECT with a VALUES ?type clause walks the graph index
+        once instead of running three nearly identical queries.
         """
+        companies = {
+            "QuantumHardwareCompany": [],
+            "ComponentSupplier": [],
+            "SoftwareCompany": [],
+        }
 
-        results = self.graph.query(query)
+        results = self.graph.query(self._companies_query)
         for row in results:
-            companies.append({
+            company_type = str(row[1]).split('#')[-1]
+            companies[company_type].append({
                 'uri': str(row[0]),
-                'name': str(row[1]),
-                'country': str(row[2]) if row[2] else '',
-                'website': str(row[3]) if row[3] else '',
-                'notes': str(row[4]) if row[4] else '',
+                'name': str(row[2]),
+                'country': str(row[3]) if row[3] else '',
+                'website': str(row[4]) if row[4] else '',
+                'notes': str(row[5]) if row[5] else '',
                 'type': company_type
             })
 
         return companies
 
-    def get_supply_relationships(self, valid_node_ids):
-        """Get supplier-client relationships"""
-        links = []
+    def get_supply_relationships(self, supplier_ids, client_ids):
+        """Get supplier-client relationships among the known nodes
 
-        query = """
-        PREFIX qsc: <http://quantum-supply-chain.org/ontology#>
-        SELECT ?supplier ?supplierName ?client ?clientName WHERE {
-            ?supplier qsc:hasClient ?client .
-            ?supplier qsc:name ?supplierName .
-            ?client qsc:name ?clientName .
-        }
+        Walks the materialized hasClient index; resolving each endpoint is
+        two dict lookups (URI -> name -> node id), and edges touching
+        unknown nodes fall out naturally. supplier_ids/client_ids map
+        company name -> prebuilt node id.
         """
+        if not supplier_ids or not client_ids:
+            return []
 
-        results = self.graph.query(query)
-        for row in results:
-            supplier_id = f"sup_{self.normalize_name_for_id(str(row[1]))}"
-            client_id = f"hw_{self.normalize_name_for_id(str(row[3]))}"
-
-            # Only create links for nodes that actually exist
-            if supplier_id in valid_node_ids and client_id in valid_node_ids:
-                links.append({
-                    'source': supplier_id,
-                    'target': client_id,
-                    'type': 'supplies',
-                    'strength': 1
-                })
+        links = []
+        for supplier_uri, clients in self._clients_of.items():
+            source = supplier_ids.get(self._name_by_uri.get(supplier_uri))
+            if source is None:
+                continue
+            for client_uri in clients:
+                target = client_ids.get(self._name_by_uri.get(client_uri))
+                if target is not None:
+                    links.append({
+                        'source': source,
+                        'target': target,
+                        'type': 'supplies',
+                        'strength': 1
+                    })
 
         return links
 
-    def get_software_relationships(self, valid_node_ids):
-        """Get software-hardware relationships"""
-        links = []
-
-        query = """
-        PREFIX qsc: <http://quantum-supply-chain.org/ontology#>
-        SELECT ?software ?softwareName ?hardware ?hardwareName WHERE {
-            ?software qsc:supportsHardware ?hardware .
-            ?software qsc:name ?softwareName .
-            ?hardware qsc:name ?hardwareName .
-        }
-        """
+    def get_software_relationships(self, software_ids, hardware_ids):
+        """Get software-hardware relationships among the known nodes"""
+        if not software_ids or not hardware_ids:
+            return []
 
-        results = self.graph.query(query)
-        for row in results:
-            software_id = f"sw_{self.normalize_name_for_id(str(row[1]))}"
-            hardware_id = f"hw_{self.normalize_name_for_id(str(row[3]))}"
-
-            # Only create links for nodes that actually exist
-            if software_id in valid_node_ids and hardware_id in valid_node_ids:
-                links.append({
-                    'source': software_id,
-                    'target': hardware_id,
-                    'type': 'supports',
-                    'strength': 0.8
-                })
+        links = []
+        for software_uri, hardware in self._supports.items():
+            source = software_ids.get(self._name_by_uri.get(software_uri))
+            if source is None:
+                continue
+            for hardware_uri in hardware:
+                target = hardware_ids.get(self._name_by_uri.get(hardware_uri))
+                if target is not None:
+                    links.append({
+                        'source': source,
+                        'target': target,
+                        'type': 'supports',
+                        'strength': 0.8
+                    })
 
         return links
 
@@ -271,16 +341,11 @@ class OntologyVisualizer:
         # Extract name from node_id (remove type prefix)
         name = node_id.split('_', 1)[1] if '_' in node_id else node_id
 
-        query = f"""
-        PREFIX qsc: <http://quantum-supply-chain.org/ontology#>
-        SELECT ?prop ?value WHERE {{
-            ?company qsc:name "{name}" .
-            ?company ?prop ?value .
-        }}
-        """
-
         details = {'name': name}
-        results = self.graph.query(query)
+        # Binding the name as a Literal also closes the SPARQL-injection
+        # hole the old f-string interpolation left open
+        results = self.graph.query(self._node_details_query,
+                                   initBindings={'name': Literal(name)})
         for row in results:
             prop = str(row[0]).split('#')[-1]  # Get property name after #
             value = str(row[1])
@@ -291,6 +356,39 @@ class OntologyVisualizer:
 db = QuantumNewsDB()
 ontology_viz = OntologyVisualizer() if ONTOLOGY_AVAILABLE else None
 
+# Parse the ontology at startup so the first request doesn't pay for it
+if ontology_viz:
+    ontology_viz.load_ontology()
+
+# TTL response cache: endpoint key -> (expiry, body_bytes, etag). The
+# article feed changes at most once per daily run and the ontology graph
+# on manual syncs, so short TTLs keep responses fresh while skipping the
+# DB/SPARQL rebuild on repeated hits.
+_RESPONSE_CACHE = {}
+
+ARTICLES_CACHE_TTL = 30
+ONTOLOGY_CACHE_TTL = 300
+
+def cached_json_response(key, ttl, builder):
+    """Serve a JSON endpoint from the TTL cache with ETag/304 support
+
+    orjson serializes in C straight to bytes, which matters for the
+    article payload where encoding the long summary strings dominates.
+    """
+    now = time.time()
+    entry = _RESPONSE_CACHE.get(key)
+    if entry is None or entry[0] < now:
+        body = orjson.dumps(builder())
+        etag = hashlib.md5(body).hexdigest()
+        entry = (now + ttl, body, etag)
+        _RESPONSE_CACHE[key] = entry
+
+    _, body, etag = entry
+    # Let browsers skip the body entirely when they already have it
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers={'ETag': etag})
+    return Response(body, mimetype='application/json', headers={'ETag': etag})
+
 @app.route("/")
 def index():
     """Render the main page with ontology integration"""
@@ -300,12 +398,14 @@ def index():
 def get_articles():
     """API endpoint to get all articles"""
     try:
-        articles = db.get_all_articles()
-        return jsonify({
-            'status': 'success',
-            'articles': articles,
-            'count': len(articles)
-        })
+        def build():
+            articles = db.get_all_articles()
+            return {
+                'status': 'success',
+                'articles': articles,
+                'count': len(articles)
+            }
+        return cached_json_response('articles', ARTICLES_CACHE_TTL, build)
     except Exception as e:
         logging.error(f"Error fetching articles: {e}")
         return jsonify({
@@ -317,11 +417,12 @@ def get_articles():
 def get_stats():
     """API endpoint to get article statistics"""
     try:
-        stats = db.get_article_stats()
-        return jsonify({
-            'status': 'success',
-            'stats': stats
-        })
+        def build():
+            return {
+                'status': 'success',
+                'stats': db.get_article_stats()
+            }
+        return cached_json_response('stats', ARTICLES_CACHE_TTL, build)
     except Exception as e:
         logging.error(f"Error fetching stats: {e}")
         return jsonify({
@@ -348,11 +449,12 @@ def get_ontology_graph():
         }), 503
 
     try:
-        graph_data = ontology_viz.get_visualization_data()
-        return jsonify({
-            'status': 'success',
-            'data': graph_data
-        })
+        def build():
+            return {
+                'status': 'success',
+                'data': ontology_viz.get_visualization_data()
+            }
+        return cached_json_response('ontology_graph', ONTOLOGY_CACHE_TTL, build)
     except Exception as e:
         logging.error(f"Error generating ontology graph: {e}")
         return jsonify({
@@ -360,6 +462,13 @@ def get_ontology_graph():
             'message': 'Failed to generate ontology graph'
         }), 500
 
+# Node details are deterministic per node_id until the ontology changes;
+# the ttl_bucket argument rotates cache entries every ONTOLOGY_CACHE_TTL
+# seconds so edits still show up without explicit invalidation
+@lru_cache(maxsize=1024)
+def _node_details_cached(node_id, ttl_bucket):
+    return ontology_viz.get_node_details(node_id)
+
 @app.route("/api/ontology/node/<node_id>")
 def get_node_details(node_id):
     """Get detailed information for a specific node"""
@@ -370,11 +479,14 @@ def get_node_details(node_id):
         }), 503
 
     try:
-        details = ontology_viz.get_node_details(node_id)
-        return jsonify({
+        details = _node_details_cached(node_id, int(time.time() // ONTOLOGY_CACHE_TTL))
+        response = jsonify({
             'status': 'success',
             'details': details
         })
+        # Let the browser reuse its copy while users click around the graph
+        response.headers['Cache-Control'] = f'public, max-age={ONTOLOGY_CACHE_TTL}'
+        return response
     except Exception as e:
         logging.error(f"Error getting node details: {e}")
         return jsonify({
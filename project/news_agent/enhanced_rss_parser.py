@@ -1,11 +1,17 @@
+import asyncio
 import feedparser
 import sqlite3
+import aiosqlite
 import requests
+from requests.adapters import HTTPAdapter
 from newspaper import Article
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 import logging
 import os
 
+from db import PRAGMAS, get_pool
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -13,37 +19,216 @@ class QuantumRSSParser:
     def __init__(self, db_path="quantum_news_rss.db"):
         self.rss_url = "https://news.mit.edu/topic/mitquantum-computing-rss.xml"
         self.db_path = db_path
+        # Shared process-wide pool (same one enhanced_app reads from), so
+        # parser writes hit the WAL pages the app's readers already see
+        self._pool = get_pool(db_path)
+        self._async_conn = None
+        # Serializes writes on the shared aiosqlite connection: aiosqlite
+        # only serializes single statements, so without this two gathered
+        # batches can interleave their BEGIN/executemany/commit sequences
+        self._db_lock = asyncio.Lock()
+        # Shared keep-alive session so bulk article fetches reuse
+        # connections instead of a fresh TLS handshake per URL
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self.setup_database()
 
     def setup_database(self):
-        """Initialize database with updated schema"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create table with content field for full article content
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS quantum_news_rss (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            author TEXT,
-            publish_date TEXT,
-            article_link TEXT UNIQUE NOT NULL,
-            content TEXT,
-            ai_summary TEXT,
-            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        """Initialize database with updated schema
+
+        The whole DDL (table, indexes, cache tables) goes through one
+        executescript on the pooled write connection: a single pass at
+        startup instead of an open/execute/close round per statement.
+        """
+        with self._pool.write() as conn:
+            conn.executescript("""
+            -- Article table with content field for full article content
+            CREATE TABLE IF NOT EXISTS quantum_news_rss (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                author TEXT,
+                publish_date TEXT,
+                article_link TEXT UNIQUE NOT NULL,
+                content TEXT,
+                ai_summary TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- Index for the WHERE ai_summary IS NULL / != '' filters used
+            -- by the backlog query and the stats counts
+            CREATE INDEX IF NOT EXISTS idx_qnr_summary_null ON quantum_news_rss(ai_summary);
+
+            -- Partial indexes that exactly match the two hot predicates:
+            -- the app's summarized-articles listing (index-range scan that
+            -- stops after LIMIT rows) and the backlog's missing-summary
+            -- lookup
+            CREATE INDEX IF NOT EXISTS idx_summary_recent
+            ON quantum_news_rss(created_at DESC)
+            WHERE ai_summary IS NOT NULL AND ai_summary != '';
+
+            CREATE INDEX IF NOT EXISTS idx_no_summary
+            ON quantum_news_rss(id)
+            WHERE ai_summary IS NULL OR ai_summary = '';
+
+            -- Cache of generated summaries keyed by SHA-256 of normalized
+            -- content, so republished/near-duplicate articles skip the
+            -- LLM call
+            CREATE TABLE IF NOT EXISTS summaries_cache (
+                hash TEXT PRIMARY KEY,
+                summary TEXT
+            );
 
-        conn.commit()
-        conn.close()
+            -- Last-seen ETag/Last-Modified per feed URL for conditional
+            -- GETs
+            CREATE TABLE IF NOT EXISTS feed_meta (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                modified TEXT
+            );
+            """)
         logging.info("Database initialized successfully")
 
+    async def _get_async_conn(self):
+        """Lazily open the shared aiosqlite connection with PRAGMAs applied
+
+        A single long-lived connection avoids per-call open/fsync overhead,
+        and aiosqlite keeps the event loop free during DB waits while the
+        concurrent summarization tasks are in flight.
+        """
+        if self._async_conn is None:
+            async with self._db_lock:
+                # Re-check under the lock so concurrent first users don't
+                # each open their own connection
+                if self._async_conn is None:
+                    conn = await aiosqlite.connect(self.db_path)
+                    for pragma in PRAGMAS:
+                        await conn.execute(pragma)
+                    self._async_conn = conn
+        return self._async_conn
+
+    async def aclose(self):
+        """Close the shared aiosqlite connection if it was opened
+
+        aiosqlite runs each connection on a non-daemon worker thread, so
+        an unclosed connection keeps the interpreter (or a scheduler
+        child process) alive after the work is done.
+        """
+        async with self._db_lock:
+            if self._async_conn is not None:
+                conn, self._async_conn = self._async_conn, None
+                await conn.close()
+
+    async def aget_articles_without_summary(self):
+        """Async variant of get_articles_without_summary"""
+        conn = await self._get_async_conn()
+        cursor = await conn.execute("""
+            SELECT id, title, content, article_link
+            FROM quantum_news_rss
+            WHERE ai_summary IS NULL OR ai_summary = ''
+        """)
+        articles = await cursor.fetchall()
+        await cursor.close()
+        return articles
+
+    async def aupdate_article_summary(self, article_id, summary):
+        """Async variant of update_article_summary"""
+        try:
+            conn = await self._get_async_conn()
+            async with self._db_lock:
+                await conn.execute("""
+                    UPDATE quantum_news_rss
+                    SET ai_summary = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (summary, article_id))
+                await conn.commit()
+            logging.info(f"Summary updated for article ID: {article_id}")
+            return True
+        except Exception as e:
+            logging.error(f"Error updating summary: {e}")
+            return False
+
+    async def aupdate_many_summaries(self, pairs):
+        """Update several article summaries in one transaction
+
+        One executemany inside a single BEGIN/COMMIT means one fsync and
+        one statement prepare for the whole batch instead of per row.
+
+        Args:
+            pairs: List of (summary, article_id) tuples
+
+        Returns:
+            True if the batch committed
+        """
+        try:
+            conn = await self._get_async_conn()
+            # Hold the lock across the whole BEGIN/executemany/commit so a
+            # concurrently finishing batch can't interleave its own
+            # transaction (or commit this one half-written)
+            async with self._db_lock:
+                await conn.execute("BEGIN IMMEDIATE")
+                await conn.executemany("""
+                    UPDATE quantum_news_rss
+                    SET ai_summary = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, pairs)
+                await conn.commit()
+            logging.info(f"Summaries updated for {len(pairs)} articles")
+            return True
+        except Exception as e:
+            logging.error(f"Error updating summaries: {e}")
+            return False
+
+    def get_cached_summary(self, content_hash):
+        """Look up a cached summary by content hash"""
+        with self._pool.read() as conn:
+            cursor = conn.execute(
+                "SELECT summary FROM summaries_cache WHERE hash = ?", (content_hash,))
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def cache_summary(self, content_hash, summary):
+        """Store a generated summary keyed by content hash"""
+        try:
+            with self._pool.write() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO summaries_cache (hash, summary)
+                    VALUES (?, ?)
+                """, (content_hash, summary))
+        except Exception as e:
+            logging.error(f"Error caching summary: {e}")
+
+    def _get_feed_meta(self):
+        """Fetch the stored (etag, modified) pair for the feed URL"""
+        with self._pool.read() as conn:
+            cursor = conn.execute(
+                "SELECT etag, modified FROM feed_meta WHERE url = ?", (self.rss_url,))
+            row = cursor.fetchone()
+        return tuple(row) if row else (None, None)
+
+    def _save_feed_meta(self, etag, modified):
+        """Persist the feed's validators for the next conditional GET"""
+        try:
+            with self._pool.write() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO feed_meta (url, etag, modified)
+                    VALUES (?, ?, ?)
+                """, (self.rss_url, etag, modified))
+        except Exception as e:
+            logging.error(f"Error saving feed metadata: {e}")
+
     def extract_article_content(self, url):
         """Extract full article content from URL"""
         try:
+            # Fetch over the shared session and hand the HTML to newspaper,
+            # skipping Article.download's own per-call urllib connection
+            response = self._session.get(url, timeout=10)
+            response.raise_for_status()
+
             article = Article(url)
-            article.download()
+            article.set_html(response.text)
             article.parse()
 
             return {
@@ -56,27 +241,37 @@ class QuantumRSSParser:
             logging.error(f"Error extracting content from {url}: {e}")
             return None
 
+    def fetch_many(self, urls):
+        """Extract several articles concurrently
+
+        Article fetching is pure network wait, so a thread pool over the
+        shared session drops bulk extraction from N round-trips to ~1.
+
+        Args:
+            urls: List of article URLs
+
+        Returns:
+            List of extraction dicts (None entries for failed URLs)
+        """
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(self.extract_article_content, urls))
+
     def article_exists(self, link):
         """Check if article already exists in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM quantum_news_rss WHERE article_link = ?", (link,))
-        exists = cursor.fetchone() is not None
-        conn.close()
-        return exists
+        with self._pool.read() as conn:
+            cursor = conn.execute(
+                "SELECT id FROM quantum_news_rss WHERE article_link = ?", (link,))
+            return cursor.fetchone() is not None
 
     def save_article(self, title, author, publish_date, link, content):
         """Save article to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
-                INSERT INTO quantum_news_rss (title, author, publish_date, article_link, content)
-                VALUES (?, ?, ?, ?, ?)
-            """, (title, author, publish_date, link, content))
-            conn.commit()
-            article_id = cursor.lastrowid
+            with self._pool.write() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO quantum_news_rss (title, author, publish_date, article_link, content)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (title, author, publish_date, link, content))
+                article_id = cursor.lastrowid
             logging.info(f"Article saved with ID: {article_id}")
             return article_id
         except sqlite3.IntegrityError:
@@ -85,20 +280,32 @@ class QuantumRSSParser:
         except Exception as e:
             logging.error(f"Error saving article: {e}")
             return None
-        finally:
-            conn.close()
 
     def fetch_latest_article(self):
         """Fetch the newest article from RSS feed if not already stored"""
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(self.rss_url)
+            # Conditional GET: send the last-seen validators so an
+            # unchanged feed comes back as a bodyless 304
+            etag, modified = self._get_feed_meta()
+            feed = feedparser.parse(self.rss_url, etag=etag, modified=modified)
+
+            if getattr(feed, 'status', None) == 304:
+                logging.info("RSS feed unchanged since last fetch (304)")
+                return None
 
             if feed.bozo:
                 logging.error("Failed to parse RSS feed")
                 return None
 
+            # Only persist the new validators once the latest entry has been
+            # fully handled (saved, already stored, or feed empty); saving
+            # them earlier would turn a transient extract/save failure into
+            # a permanent skip via 304s on every later poll
+            new_etag = getattr(feed, 'etag', None)
+            new_modified = getattr(feed, 'modified', None)
+
             if not feed.entries:
+                self._save_feed_meta(new_etag, new_modified)
                 logging.info("No entries found in RSS feed")
                 return None
 
@@ -108,6 +315,7 @@ class QuantumRSSParser:
 
             # Check if we already have this article
             if self.article_exists(article_link):
+                self._save_feed_meta(new_etag, new_modified)
                 logging.info(f"Article already exists: {article_link}")
                 return None
 
@@ -127,6 +335,7 @@ class QuantumRSSParser:
             article_id = self.save_article(title, author, publish_date, article_link, content)
 
             if article_id:
+                self._save_feed_meta(new_etag, new_modified)
                 logging.info(f"Successfully processed new article: {title}")
                 return {
                     'id': article_id,
@@ -145,36 +354,28 @@ class QuantumRSSParser:
 
     def get_articles_without_summary(self):
         """Get articles that don't have AI summary yet"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, title, content, article_link
-            FROM quantum_news_rss
-            WHERE ai_summary IS NULL OR ai_summary = ''
-        """)
-        articles = cursor.fetchall()
-        conn.close()
-        return articles
+        with self._pool.read() as conn:
+            cursor = conn.execute("""
+                SELECT id, title, content, article_link
+                FROM quantum_news_rss
+                WHERE ai_summary IS NULL OR ai_summary = ''
+            """)
+            return cursor.fetchall()
 
     def update_article_summary(self, article_id, summary):
         """Update article with AI-generated summary"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
-                UPDATE quantum_news_rss
-                SET ai_summary = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, (summary, article_id))
-            conn.commit()
+            with self._pool.write() as conn:
+                conn.execute("""
+                    UPDATE quantum_news_rss
+                    SET ai_summary = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (summary, article_id))
             logging.info(f"Summary updated for article ID: {article_id}")
             return True
         except Exception as e:
             logging.error(f"Error updating summary: {e}")
             return False
-        finally:
-            conn.close()
 
 if __name__ == "__main__":
     parser = QuantumRSSParser()
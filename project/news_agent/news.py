@@ -1,25 +1,37 @@
-import newspaper
+import feedparser
+import requests
+from newspaper import Article
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+# Shared keep-alive session for article downloads
+_session = requests.Session()
+
 def extract_news(url_string):
-    """ Extracts quantum computing news articles from the given source """
-    #news_source = 'https://news.mit.edu/2025/device-enables-direct-communication-among-multiple-quantum-processors-0321'
-    paper = newspaper.build(url_string, memoize_articles=False)
+    """ Extracts quantum computing news articles from the given RSS feed
 
-    #articles_data = []  # Store extracted articles
+    The feed already lists the candidate article links, so this does one
+    feed request plus one article fetch for the first quantum match,
+    instead of newspaper.build crawling the whole source site.
+    """
+    feed = feedparser.parse(url_string)
 
-    for article in paper.articles:
-        if 'quantum' in article.url.lower():
+    for entry in feed.entries:
+        link = entry.get("link", "")
+        if 'quantum' in link.lower():
             try:
-                article.download()
+                response = _session.get(link, timeout=10)
+                response.raise_for_status()
+
+                article = Article(link)
+                article.set_html(response.text)
                 article.parse()
 
                 article_info = {
                     "title": article.title,
-                    "url": article.url,
+                    "url": link,
                     "summary": article.text  # Trim to 500 characters
                 }
 
@@ -29,6 +41,6 @@ def extract_news(url_string):
                 return article_info  # Stop after first match
 
             except Exception as e:
-                logging.warning(f"Error processing article {article.url}: {e}")
+                logging.warning(f"Error processing article {link}: {e}")
 
     return None
@@ -4,12 +4,15 @@ Quantum News Scheduler
 Runs the daily news processing at scheduled intervals
 """
 
-import schedule
 import time
-import subprocess
+import asyncio
 import logging
+import multiprocessing
+import signal
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
+
+import daily_runner
 
 # Configure logging
 logging.basicConfig(
@@ -21,48 +24,78 @@ logging.basicConfig(
     ]
 )
 
+def _run_daily_job(result_queue):
+    """Run the daily workflow and report the result back to the parent"""
+    processor = daily_runner.DailyNewsProcessor()
+    result_queue.put(asyncio.run(processor.run_daily_process()))
+
 def run_daily_processing():
-    """Execute the daily processing script"""
+    """Execute the daily processing in a terminable child process
+
+    daily_runner is imported once here, so forked children inherit the
+    heavy feedparser/newspaper/ADK stack already loaded instead of
+    re-importing it per day as subprocess.run used to. Running in a
+    process (not a thread) keeps the 30-minute timeout real: a hung run
+    is terminated instead of lingering and wedging every later run.
+    """
     try:
         logging.info(f"Starting scheduled daily processing at {datetime.now()}")
 
-        # Run the daily processing script
-        result = subprocess.run(
-            [sys.executable, "daily_runner.py"],
-            capture_output=True,
-            text=True,
-            timeout=1800  # 30 minute timeout
-        )
+        result_queue = multiprocessing.Queue(maxsize=1)
+        job = multiprocessing.Process(target=_run_daily_job, args=(result_queue,))
+        job.start()
+        job.join(timeout=1800)  # 30 minute timeout
+
+        if job.is_alive():
+            job.terminate()
+            job.join()
+            logging.error("❌ Daily processing timed out after 30 minutes and was terminated")
+            return
+
+        try:
+            result = result_queue.get(timeout=5)
+        except Exception:
+            logging.error(f"❌ Daily processing exited without a result (exit code {job.exitcode})")
+            return
 
-        if result.returncode == 0:
+        if result['status'] == 'success':
             logging.info("✅ Daily processing completed successfully")
-            if result.stdout:
-                logging.info(f"Output: {result.stdout}")
         else:
-            logging.error(f"❌ Daily processing failed with return code {result.returncode}")
-            if result.stderr:
-                logging.error(f"Error output: {result.stderr}")
+            logging.error(f"❌ Daily processing failed: {result.get('error', 'Unknown error')}")
 
-    except subprocess.TimeoutExpired:
-        logging.error("❌ Daily processing timed out after 30 minutes")
     except Exception as e:
         logging.error(f"❌ Error running daily processing: {e}")
 
+RUN_AT_HOUR = 8
+
+def seconds_until_next_run():
+    """Seconds until the next daily run time"""
+    now = datetime.now()
+    target = now.replace(hour=RUN_AT_HOUR, minute=0, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+def _handle_sigterm(signum, frame):
+    logging.info("Scheduler stopped by SIGTERM")
+    sys.exit(0)
+
 def main():
-    """Main scheduler loop"""
-    logging.info("Quantum News Scheduler started")
-    logging.info("Scheduled to run daily at 8:00 AM")
+    """Main scheduler loop
 
-    # Schedule daily processing at 8:00 AM
-    schedule.every().day.at("08:00").do(run_daily_processing)
+    One absolute sleep until the next 08:00 instead of waking every
+    minute to poll a schedule table: the process stays fully idle
+    between runs.
+    """
+    logging.info("Quantum News Scheduler started")
+    logging.info(f"Scheduled to run daily at {RUN_AT_HOUR}:00 AM")
 
-    # Optional: Run immediately on startup for testing
-    # schedule.every().minute.do(run_daily_processing)  # Uncomment for testing
+    signal.signal(signal.SIGTERM, _handle_sigterm)
 
     try:
         while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            time.sleep(seconds_until_next_run())
+            run_daily_processing()
 
     except KeyboardInterrupt:
         logging.info("Scheduler stopped by user")
@@ -4,12 +4,83 @@ Quantum Supply Chain Data Schema
 Provides structured format for adding new supply chain information to the ontology
 """
 
+import hashlib
 import json
+import os
+import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, asdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from typing import Dict, List, Optional, Union, get_args, get_origin, get_type_hints
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+# Per-class cache of which fields hold enums: (scalar names, list names).
+# Field inspection runs once per dataclass type instead of probing every
+# value on every add.
+_ENUM_FIELD_CACHE = {}
+
+def _enum_fields(cls):
+    """Names of enum-valued and enum-list fields, cached per class"""
+    cached = _ENUM_FIELD_CACHE.get(cls)
+    if cached is None:
+        names, scalars, enum_lists = [], [], []
+        hints = get_type_hints(cls)
+        for f in fields(cls):
+            # Derived (init=False) fields like name_lc stay in-memory only
+            if not f.init:
+                continue
+            names.append(f.name)
+            hint = hints.get(f.name, f.type)
+            if get_origin(hint) is Union:
+                args = [a for a in get_args(hint) if a is not type(None)]
+                if len(args) == 1:
+                    hint = args[0]
+            if isinstance(hint, type) and issubclass(hint, Enum):
+                scalars.append(f.name)
+            elif get_origin(hint) is list:
+                item_type = (get_args(hint) or (None,))[0]
+                if isinstance(item_type, type) and issubclass(item_type, Enum):
+                    enum_lists.append(f.name)
+        cached = _ENUM_FIELD_CACHE[cls] = (tuple(names), scalars, enum_lists)
+    return cached
+
+def _to_dict(obj) -> Dict:
+    """Flat dict of a record dataclass with enum fields converted"""
+    names, scalars, enum_lists = _enum_fields(type(obj))
+    d = {name: getattr(obj, name) for name in names}
+    # Enum fields may hold raw value strings when records were built from
+    # user-supplied dicts, so only unwrap actual enum members
+    for name in scalars:
+        value = d[name]
+        if value is not None and hasattr(value, 'value'):
+            d[name] = value.value
+    for name in enum_lists:
+        value = d[name]
+        if value:
+            d[name] = [item.value if hasattr(item, 'value') else item for item in value]
+    return d
+
+# Timestamp cache: add paths only need second granularity, so refresh
+# the ISO string at most once per second instead of constructing and
+# formatting a datetime per record
+_CACHED_ISO = ""
+_CACHED_ISO_AT = 0.0
+
+def _now_iso() -> str:
+    """Current ISO timestamp, cached for up to one second"""
+    global _CACHED_ISO, _CACHED_ISO_AT
+    now = time.monotonic()
+    if now - _CACHED_ISO_AT >= 1.0 or not _CACHED_ISO:
+        _CACHED_ISO = datetime.now().isoformat()
+        _CACHED_ISO_AT = now
+    return _CACHED_ISO
+
 class CompanyType(Enum):
     """Company types in the quantum supply chain"""
     HARDWARE = "hardware"
@@ -30,6 +101,10 @@ class QuantumModality(Enum):
     QUANTUM_ANNEALING = "QuantumAnnealing"
     TOPOLOGICAL = "TopologicalQubit"
 
+# Closed set of modality value strings, for validation and for keeping
+# in-memory modalities as interned frozensets
+_MODALITY_VALUES = frozenset(m.value for m in QuantumModality)
+
 class ComponentType(Enum):
     """Types of components in quantum systems"""
     SUPERCONDUCTING_WIRE = "superconducting_wire"
@@ -43,7 +118,7 @@ class ComponentType(Enum):
     PHOTONIC_COMPONENT = "photonic_component"
     DILUTION_REFRIGERATOR = "dilution_refrigerator"
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Base company information"""
     name: str
@@ -58,38 +133,53 @@ class Company:
     operational_status: str = "active"
     notes: Optional[str] = None
     data_source: Optional[str] = None
-    last_updated: str = datetime.now().isoformat()
+    # default_factory: the old class-level datetime.now() default was
+    # frozen at import time, stamping every instance with the same value
+    last_updated: str = field(default_factory=_now_iso)
+    # Canonical lookup key, computed once per instance in __post_init__
+    name_lc: str = field(init=False)
+
+    def __post_init__(self):
+        self.name_lc = sys.intern(self.name.strip().lower())
 
-@dataclass
+    def to_dict(self) -> Dict:
+        """Flat dict with enums converted, without asdict's recursive copy
+
+        The shared helper knows each class's enum fields from the cached
+        inspection, so subclasses inherit this unchanged.
+        """
+        return _to_dict(self)
+
+@dataclass(slots=True)
 class HardwareCompany(Company):
     """Quantum hardware company"""
-    modalities: List[QuantumModality]
+    modalities: List[QuantumModality] = None
     platforms: List[str] = None
     qubit_count: Optional[int] = None
     quantum_volume: Optional[int] = None
     cloud_service: bool = False
     partnerships: List[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ComponentSupplier(Company):
     """Component supplier company"""
-    component_types: List[ComponentType]
+    component_types: List[ComponentType] = None
     materials_supplied: List[str] = None
     clients: List[str] = None
     applications: List[str] = None
     technical_specs: Dict[str, Union[str, float]] = None
 
-@dataclass
+@dataclass(slots=True)
 class SoftwareCompany(Company):
     """Software/SDK company"""
-    products: List[str]
+    products: List[str] = None
     programming_languages: List[str] = None
     supported_hardware: List[str] = None
     license_type: str = "proprietary"
     github_url: Optional[str] = None
     documentation_url: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Partnership:
     """Partnership between companies"""
     company1: str
@@ -99,7 +189,11 @@ class Partnership:
     start_date: Optional[str] = None
     status: str = "active"
 
-@dataclass
+    def to_dict(self) -> Dict:
+        """Flat dict copy; no nested fields to convert"""
+        return _to_dict(self)
+
+@dataclass(slots=True)
 class Product:
     """Product or service"""
     name: str
@@ -111,23 +205,215 @@ class Product:
     release_date: Optional[str] = None
     status: str = "active"
 
+    def to_dict(self) -> Dict:
+        """Flat dict with the optional modality enum converted"""
+        return _to_dict(self)
+
+def _freeze_company_sets(company_dict):
+    """Store modalities/clients as interned frozensets for O(1) membership
+
+    Modality strings come from a closed 7-element set and client names
+    repeat heavily across suppliers, so interning makes later
+    comparisons pointer-equality fast.
+    """
+    if company_dict.get("modalities"):
+        company_dict["modalities"] = frozenset(
+            sys.intern(m) for m in company_dict["modalities"])
+    if company_dict.get("clients"):
+        company_dict["clients"] = frozenset(
+            sys.intern(c) for c in company_dict["clients"])
+
+# Categorical fields whose values repeat across thousands of records;
+# interning them after decode collapses the duplicates to one object
+# each and makes later comparisons pointer-fast
+_COMPANY_INTERN_FIELDS = ("company_type", "country", "region", "operational_status")
+_PARTNERSHIP_INTERN_FIELDS = ("company1", "company2", "partnership_type", "status")
+
+def _intern_fields(record, field_names):
+    """sys.intern the given string fields of a decoded record"""
+    for key in field_names:
+        value = record.get(key)
+        if isinstance(value, str):
+            record[key] = sys.intern(value)
+
+def _json_default(obj):
+    """default= hook for the frozenset fields only
+
+    Everything else is normalized to JSON-native types at ingest
+    (to_dict converts enums, timestamps are already ISO strings), so any
+    other type reaching the encoder is a bug worth surfacing rather than
+    silently str()-ing.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Unexpected non-JSON value in dataset: {obj!r}")
+
+def _jsonl_dumps(record) -> bytes:
+    """Encode one record as a JSON line
+
+    Log records are JSON-native dicts straight from to_dict, so no
+    default= fallback is needed and the encoder stays on its C path.
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+def _read_jsonl(path) -> List[Dict]:
+    """Read all records from a JSONL file ([] if it doesn't exist)"""
+    loads = orjson.loads if orjson is not None else json.loads
+    try:
+        with open(path, 'rb') as f:
+            return [loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+# Process-wide dataset cache: schema_file -> (file mtimes, parsed data).
+# Re-instantiating a manager against unchanged files skips the re-parse.
+_LOAD_CACHE = {}
+
+def _dataset_stamp(paths):
+    """mtime_ns tuple for the dataset files (None where missing)"""
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
 class SupplyChainDataManager:
-    """Manager for supply chain data operations"""
+    """Manager for supply chain data operations
+
+    Companies and metadata live in the main JSON file; partnerships and
+    products are append-only JSONL sidecar logs, so adding one record
+    writes one line instead of rewriting the whole dataset.
+    """
 
     def __init__(self, schema_file="supply_chain_data.json"):
         self.schema_file = schema_file
+        base, _ = os.path.splitext(schema_file)
+        self._partnerships_file = base + ".partnerships.jsonl"
+        self._products_file = base + ".products.jsonl"
+        self._part_fp = None
+        self._prod_fp = None
+        self._buffered = False
+        self._dirty = False
+        self._migrated_legacy = False
+        self._last_saved_digest = None
         self.data = self.load_data()
+        if self._migrated_legacy:
+            # Drop the now-logged records from the main file so the next
+            # load doesn't read them twice
+            self.save_data()
+        self._build_query_indexes()
+
+    def _build_query_indexes(self):
+        """Build the inverted modality/client indexes in one pass
+
+        Large datasets use a vectorized pandas explode/groupby pass when
+        pandas is available (the Excel tooling already depends on it);
+        below the threshold the plain loop wins because it skips the
+        DataFrame construction and import cost.
+        """
+        companies = self.data["companies"]
+        if len(companies) > 1000 and self._build_indexes_vectorized(companies):
+            return
+        self._by_modality = {}
+        self._by_client = {}
+        for i, company in enumerate(companies):
+            self._index_company(i, company)
+
+    def _build_indexes_vectorized(self, companies):
+        """pandas-based index build; returns False if pandas is missing"""
+        try:
+            import pandas as pd
+        except ImportError:
+            return False
+
+        modalities = pd.Series(
+            [tuple(c.get("modalities") or ()) for c in companies]).explode().dropna()
+        self._by_modality = {
+            key: list(idx) for key, idx in modalities.index.groupby(modalities).items()}
+
+        clients = pd.Series(
+            [tuple(cl.strip().lower() for cl in c.get("clients") or ())
+             if c.get("company_type") == "supplier" else ()
+             for c in companies]).explode().dropna()
+        self._by_client = {
+            key: list(idx) for key, idx in clients.index.groupby(clients).items()}
+        return True
+
+    def _index_company(self, i, company):
+        """Register company (at list index i) in the query indexes"""
+        for modality in company.get("modalities") or []:
+            self._by_modality.setdefault(modality, []).append(i)
+        if company.get("company_type") == "supplier":
+            # Key by canonical lowercase name so lookups are
+            # case-insensitive without per-lookup rescans
+            for client in company.get("clients") or []:
+                self._by_client.setdefault(
+                    sys.intern(client.strip().lower()), []).append(i)
+
+    def _log_fp(self, path, fp_attr):
+        """Lazily open (and cache) a buffered append handle for a log"""
+        fp = getattr(self, fp_attr)
+        if fp is None:
+            fp = open(path, 'ab', buffering=1 << 16)
+            setattr(self, fp_attr, fp)
+        return fp
+
+    def _append_log(self, path, fp_attr, record):
+        """Append one record to a JSONL log through a buffered writer"""
+        fp = self._log_fp(path, fp_attr)
+        fp.write(_jsonl_dumps(record))
+        # Keep per-add durability outside buffered() blocks; batched adds
+        # flush once on exit
+        if not self._buffered:
+            fp.flush()
+
+    @contextmanager
+    def buffered(self):
+        """Defer saves so a batch of adds produces one file rewrite
+
+        Each add_* call rewrites the whole JSON file, making N adds cost
+        O(N * dataset). Inside this context the saves coalesce into a
+        single write on exit.
+        """
+        self._buffered = True
+        try:
+            yield self
+        finally:
+            self._buffered = False
+            if self._dirty:
+                self.save_data()
+                self._dirty = False
+            for fp in (self._part_fp, self._prod_fp):
+                if fp is not None:
+                    fp.flush()
 
     def load_data(self) -> Dict:
-        """Load existing data from JSON file"""
+        """Load existing data from the JSON file and JSONL logs
+
+        Served from the module cache when none of the dataset files have
+        changed since the last parse, so repeated instantiations against
+        the same file are effectively free.
+        """
+        dataset_files = (self.schema_file, self._partnerships_file, self._products_file)
+        stamp = _dataset_stamp(dataset_files)
+        cached = _LOAD_CACHE.get(self.schema_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         try:
-            with open(self.schema_file, 'r') as f:
-                return json.load(f)
+            if orjson is not None:
+                with open(self.schema_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.schema_file, 'r') as f:
+                    data = json.load(f)
         except FileNotFoundError:
-            return {
+            data = {
                 "companies": [],
-                "partnerships": [],
-                "products": [],
                 "metadata": {
                     "version": "1.0",
                     "last_updated": datetime.now().isoformat(),
@@ -135,63 +421,167 @@ class SupplyChainDataManager:
                 }
             }
 
+        for key, path, fp_attr in (
+            ("partnerships", self._partnerships_file, "_part_fp"),
+            ("products", self._products_file, "_prod_fp"),
+        ):
+            appended = _read_jsonl(path)
+            legacy = data.get(key) or []
+            if legacy and not appended:
+                # Older files kept these inline; migrate them to the log
+                # once so future saves stay append-only
+                for record in legacy:
+                    self._append_log(path, fp_attr, record)
+                self._migrated_legacy = True
+            data[key] = legacy + appended
+
+        for company in data.get("companies") or []:
+            _freeze_company_sets(company)
+            _intern_fields(company, _COMPANY_INTERN_FIELDS)
+        for partnership in data.get("partnerships") or []:
+            _intern_fields(partnership, _PARTNERSHIP_INTERN_FIELDS)
+
+        _LOAD_CACHE[self.schema_file] = (_dataset_stamp(dataset_files), data)
+        return data
+
     def save_data(self):
         """Save data to JSON file"""
-        self.data["metadata"]["last_updated"] = datetime.now().isoformat()
+        if self._buffered:
+            self._dirty = True
+            return
+
+        # Skip the rewrite when the companies payload is unchanged: a
+        # repeated idempotent save would only refresh the timestamp,
+        # which is not worth the write syscalls
+        if orjson is not None:
+            content = orjson.dumps(self.data["companies"], default=_json_default)
+        else:
+            content = json.dumps(self.data["companies"], default=_json_default).encode()
+        digest = hashlib.blake2b(content).digest()
+        if digest == self._last_saved_digest:
+            return
+        self._last_saved_digest = digest
+
+        # The files are about to change; drop the cached parse
+        _LOAD_CACHE.pop(self.schema_file, None)
+
+        self.data["metadata"]["last_updated"] = _now_iso()
         self.data["metadata"]["total_companies"] = len(self.data["companies"])
 
-        with open(self.schema_file, 'w') as f:
-            json.dump(self.data, f, indent=2, default=str)
+        # Only companies + metadata go in the main file; partnerships and
+        # products live in their append-only logs
+        payload = {k: v for k, v in self.data.items()
+                   if k not in ("partnerships", "products")}
+
+        # orjson encodes in C straight to bytes; the whole-file rewrite
+        # per add makes serialization the dominant cost here
+        if orjson is not None:
+            with open(self.schema_file, 'wb') as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2, default=_json_default))
+        else:
+            with open(self.schema_file, 'w') as f:
+                json.dump(payload, f, indent=2, default=_json_default)
 
     def add_company(self, company: Union[Company, HardwareCompany, ComponentSupplier, SoftwareCompany]):
         """Add a new company to the dataset"""
-        company_dict = asdict(company)
-        # Convert enums to strings
-        for key, value in company_dict.items():
-            if isinstance(value, list) and value and hasattr(value[0], 'value'):
-                company_dict[key] = [item.value for item in value]
-            elif hasattr(value, 'value'):
-                company_dict[key] = value.value
-
+        # to_dict builds the dict in one pass with enums already
+        # converted, skipping asdict's recursive deepcopy and the
+        # follow-up enum fix-up loop
+        company_dict = company.to_dict()
+        _freeze_company_sets(company_dict)
         self.data["companies"].append(company_dict)
+        self._index_company(len(self.data["companies"]) - 1, company_dict)
         self.save_data()
 
     def add_partnership(self, partnership: Partnership):
-        """Add a new partnership"""
-        self.data["partnerships"].append(asdict(partnership))
-        self.save_data()
+        """Add a new partnership (one appended log line, no file rewrite)"""
+        record = partnership.to_dict()
+        self.data["partnerships"].append(record)
+        self._append_log(self._partnerships_file, "_part_fp", record)
 
     def add_product(self, product: Product):
-        """Add a new product"""
-        product_dict = asdict(product)
-        if product_dict.get('modality') and hasattr(product_dict['modality'], 'value'):
-            product_dict['modality'] = product_dict['modality'].value
-
-        self.data["products"].append(product_dict)
+        """Add a new product (one appended log line, no file rewrite)"""
+        record = product.to_dict()
+        self.data["products"].append(record)
+        self._append_log(self._products_file, "_prod_fp", record)
+
+    def add_companies(self, companies) -> int:
+        """Add many companies with one save and one index sweep
+
+        Converts the whole batch first, extends the list once, then
+        indexes the new slice — one file rewrite instead of N.
+        """
+        new = []
+        for company in companies:
+            company_dict = company.to_dict()
+            _freeze_company_sets(company_dict)
+            new.append(company_dict)
+        start = len(self.data["companies"])
+        self.data["companies"].extend(new)
+        for i, company_dict in enumerate(new, start):
+            self._index_company(i, company_dict)
         self.save_data()
+        return len(new)
+
+    def add_partnerships(self, partnerships) -> int:
+        """Add many partnerships with one log flush"""
+        count = 0
+        for partnership in partnerships:
+            record = partnership.to_dict()
+            self.data["partnerships"].append(record)
+            self._log_fp(self._partnerships_file, "_part_fp").write(_jsonl_dumps(record))
+            count += 1
+        if count:
+            self._part_fp.flush()
+        return count
+
+    def add_products(self, products) -> int:
+        """Add many products with one log flush"""
+        count = 0
+        for product in products:
+            record = product.to_dict()
+            self.data["products"].append(record)
+            self._log_fp(self._products_file, "_prod_fp").write(_jsonl_dumps(record))
+            count += 1
+        if count:
+            self._prod_fp.flush()
+        return count
 
     def get_companies_by_modality(self, modality: QuantumModality) -> List[Dict]:
-        """Get all companies working with specific modality"""
-        result = []
-        for company in self.data["companies"]:
-            if "modalities" in company and modality.value in company["modalities"]:
-                result.append(company)
-        return result
+        """Get all companies working with specific modality
+
+        O(result size) lookup against the inverted index instead of a
+        full scan with per-company membership tests.
+        """
+        companies = self.data["companies"]
+        return [companies[i] for i in self._by_modality.get(modality.value, [])]
 
     def get_suppliers_for_client(self, client_name: str) -> List[Dict]:
-        """Get all suppliers for a specific client"""
-        result = []
-        for company in self.data["companies"]:
-            if company.get("company_type") == "supplier" and company.get("clients"):
-                if client_name in company["clients"]:
-                    result.append(company)
-        return result
+        """Get all suppliers for a specific client (case-insensitive)"""
+        companies = self.data["companies"]
+        key = client_name.strip().lower()
+        return [companies[i] for i in self._by_client.get(key, [])]
+
+    def iter_companies(self, modality: Optional[QuantumModality] = None):
+        """Lazily iterate companies, optionally filtered by modality
+
+        Pulls indexes from the inverted index (or the whole range) and
+        yields the stored dicts, so streaming consumers pay nothing for
+        materialization.
+        """
+        companies = self.data["companies"]
+        if modality:
+            indexes = self._by_modality.get(modality.value, ())
+        else:
+            indexes = range(len(companies))
+        return (companies[i] for i in indexes)
 
     def export_for_ontology(self, modality: Optional[QuantumModality] = None) -> Dict:
         """Export data in format suitable for ontology loading"""
-        companies = self.data["companies"]
         if modality:
-            companies = self.get_companies_by_modality(modality)
+            companies = list(self.iter_companies(modality))
+        else:
+            companies = self.data["companies"]
 
         return {
             "modality": modality.value if modality else "all",
@@ -250,42 +640,52 @@ EXAMPLE_TEMPLATES = {
     }
 }
 
+# Templates serialized once at import; emitting one is a dict lookup
+# and a bytes write instead of a fresh dump per use
+_TEMPLATE_JSON = {
+    name: (orjson.dumps(template, option=orjson.OPT_INDENT_2)
+           if orjson is not None
+           else json.dumps(template, indent=2).encode("utf-8"))
+    for name, template in EXAMPLE_TEMPLATES.items()
+}
+
 def create_example_data():
     """Create example data file with sample entries"""
     manager = SupplyChainDataManager("example_supply_chain_data.json")
 
-    # Add example companies
-    hardware_company = HardwareCompany(
-        name="Example Quantum Corp",
-        company_type=CompanyType.HARDWARE,
-        modalities=[QuantumModality.SUPERCONDUCTING],
-        description="Leading superconducting quantum computing company",
-        country="USA",
-        founded_year=2019,
-        qubit_count=127,
-        cloud_service=True,
-        platforms=["Example Quantum Platform"]
-    )
-    manager.add_company(hardware_company)
-
-    supplier = ComponentSupplier(
-        name="SuperConductor Materials Corp",
-        company_type=CompanyType.SUPPLIER,
-        component_types=[ComponentType.SUPERCONDUCTING_WIRE, ComponentType.HTS_TAPE],
-        materials_supplied=["NbTi wire", "Nb₃Sn wire", "YBCO tape"],
-        clients=["IBM", "Google", "Rigetti"],
-        country="USA"
-    )
-    manager.add_company(supplier)
-
-    # Add partnership
-    partnership = Partnership(
-        company1="Example Quantum Corp",
-        company2="SuperConductor Materials Corp",
-        partnership_type="supplier",
-        description="Supply of superconducting materials"
-    )
-    manager.add_partnership(partnership)
+    with manager.buffered():
+        # Add example companies
+        hardware_company = HardwareCompany(
+            name="Example Quantum Corp",
+            company_type=CompanyType.HARDWARE,
+            modalities=[QuantumModality.SUPERCONDUCTING],
+            description="Leading superconducting quantum computing company",
+            country="USA",
+            founded_year=2019,
+            qubit_count=127,
+            cloud_service=True,
+            platforms=["Example Quantum Platform"]
+        )
+        manager.add_company(hardware_company)
+
+        supplier = ComponentSupplier(
+            name="SuperConductor Materials Corp",
+            company_type=CompanyType.SUPPLIER,
+            component_types=[ComponentType.SUPERCONDUCTING_WIRE, ComponentType.HTS_TAPE],
+            materials_supplied=["NbTi wire", "Nb₃Sn wire", "YBCO tape"],
+            clients=["IBM", "Google", "Rigetti"],
+            country="USA"
+        )
+        manager.add_company(supplier)
+
+        # Add partnership
+        partnership = Partnership(
+            company1="Example Quantum Corp",
+            company2="SuperConductor Materials Corp",
+            partnership_type="supplier",
+            description="Supply of superconducting materials"
+        )
+        manager.add_partnership(partnership)
 
     print("✅ Example data file created: example_supply_chain_data.json")
     return manager
@@ -297,6 +697,7 @@ if __name__ == "__main__":
     # Print templates
     print("\n📋 DATA TEMPLATES:")
     print("=" * 50)
-    for template_name, template_data in EXAMPLE_TEMPLATES.items():
+    for template_name in EXAMPLE_TEMPLATES:
         print(f"\n{template_name.upper()}:")
-        print(json.dumps(template_data, indent=2))
\ No newline at end of file
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_TEMPLATE_JSON[template_name] + b"\n")
\ No newline at end of file
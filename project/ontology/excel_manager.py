@@ -6,14 +6,320 @@ Allows users to update supply chain information via Excel spreadsheets
 
 import pandas as pd
 import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+import hashlib
 import json
 import logging
+import os
+import sys
+import zipfile
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from quantum_supply_chain_ontology import QuantumSupplyChainOntology
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Shared singletons for values repeated in every synced record
+_SRC_EXCEL = sys.intern('Excel update')
+_TYPE_HARDWARE = sys.intern('hardware')
+_TYPE_SUPPLIER = sys.intern('supplier')
+_TYPE_SOFTWARE = sys.intern('software')
+
+@lru_cache(maxsize=4096)
+def _split_csv(value):
+    """Split a comma-separated cell into non-empty stripped parts.
+
+    Cached because client and language lists repeat heavily across
+    rows and syncs; identical cells split once per process.
+    """
+    return tuple(part.strip() for part in value.split(',') if part.strip())
+
+@lru_cache(maxsize=1)
+def _build_templates():
+    """Template definitions, built once per process
+
+    The templates are constants, so they are built a single time no
+    matter how many managers or calls follow. Each sheet is a plain
+    {column: [values]} dict; no DataFrame round-trip is involved.
+    Returns {key: (filename, {sheet_name: columns})}.
+    """
+    superconducting_template = {
+        'Hardware_Companies': {
+            'Company_Name': ['IBM Quantum', 'Google Quantum AI', 'Rigetti Computing', '[Add New Company]'],
+            'Country': ['USA', 'USA', 'USA', ''],
+            'Modality': ['SuperconductingQubit', 'SuperconductingQubit', 'SuperconductingQubit', 'SuperconductingQubit'],
+            'Qubit_Count': [1000, 70, 80, ''],
+            'Cloud_Service': ['Yes', 'Yes', 'Yes', ''],
+            'Platform_Name': ['IBM Quantum Network', 'Google Quantum AI', 'Quantum Cloud Services', ''],
+            'Website': ['https://quantum.ibm.com', 'https://quantumai.google', 'https://rigetti.com', ''],
+            'Founded_Year': [1911, 1998, 2013, ''],
+            'Description': ['Leading quantum computing platform', 'Quantum AI research and platforms', 'Full-stack quantum computing', ''],
+            'Notes': ['', '', '', '']
+        },
+
+        'Component_Suppliers': {
+            'Supplier_Name': ['Super Conductor Materials Inc.', 'Sumitomo Electric Industries', 'SuperPower Inc.', '[Add New Supplier]'],
+            'Country': ['USA', 'Japan', 'USA', ''],
+            'Component_Types': ['Sputtering targets, thin-film superconductors', 'HTS wire', 'HTS tape, high-field magnets', ''],
+            'Materials_Supplied': ['NbTi, Nb₃Sn, superconducting films', 'HTS wire, Nb₃Sn', 'YBCO tape, superconducting wire', ''],
+            'Known_Clients': ['IBM, Google, Rigetti', 'Pasqal, Japanese labs', 'Tokamak Energy, DOE labs', ''],
+            'Applications': ['Quantum chips, thin films', 'Quantum logistics, magnets', 'High-field systems, cryogenics', ''],
+            'Website': ['https://scmat.com', 'https://global-sei.com', 'https://superpower-inc.com', ''],
+            'Technical_Specs': ['Sputtering targets for qubits', 'HTS wire optimization', 'High current capacity', ''],
+            'Notes': ['Primary supplier for IBM/Google', 'Partnership with Pasqal', '$80M DOE support', '']
+        },
+
+        'Software_Companies': {
+            'Software_Name': ['Qiskit', 'Cirq', 'Forest SDK', '[Add New SDK]'],
+            'Company': ['IBM', 'Google', 'Rigetti', ''],
+            'Type': ['SDK', 'SDK', 'SDK', 'SDK/Platform/Framework'],
+            'Programming_Languages': ['Python', 'Python', 'Python', ''],
+            'Supported_Hardware': ['IBM Quantum', 'Google quantum processors', 'Rigetti systems', ''],
+            'License': ['Open Source', 'Open Source', 'Open Source', ''],
+            'Website': ['https://qiskit.org', 'https://quantumai.google/cirq', 'https://rigetti.com/forest', ''],
+            'Github': ['https://github.com/Qiskit', 'https://github.com/quantumlib/Cirq', 'https://github.com/rigetti', ''],
+            'Description': ['Open-source quantum computing SDK', 'Python framework for quantum circuits', 'Quantum-classical hybrid computing', ''],
+            'Notes': ['Most popular quantum SDK', 'Focus on Google hardware', 'Hybrid workflows', '']
+        }
+    }
+
+    trapped_ion_template = {
+        'Hardware_Companies': {
+            'Company_Name': ['IonQ', 'Quantinuum (Honeywell)', 'Alpine Quantum Technologies', '[Add New Company]'],
+            'Country': ['USA', 'USA', 'Austria', ''],
+            'Modality': ['TrappedIon', 'TrappedIon', 'TrappedIon', 'TrappedIon'],
+            'Qubit_Count': [64, 56, 24, ''],
+            'Cloud_Service': ['Yes', 'Yes', 'No', ''],
+            'Platform_Name': ['IonQ Aria', 'H-Series', 'AQT Platform', ''],
+            'Website': ['https://ionq.com', 'https://quantinuum.com', 'https://aqt.eu', ''],
+            'Founded_Year': [2015, 2021, 2018, ''],
+            'Description': ['Trapped ion quantum computing leader', 'Quantum computing and software', 'Trapped ion quantum systems', ''],
+            'Notes': ['Public company (NYSE: IONQ)', 'Honeywell + Cambridge Quantum merger', 'European trapped ion leader', '']
+        },
+
+        'Component_Suppliers': {
+            'Supplier_Name': ['[Add Ion Trap Suppliers]', '[Add Laser Suppliers]', '[Add Electronics Suppliers]'],
+            'Country': ['', '', ''],
+            'Component_Types': ['Ion traps, electrodes', 'Laser systems, optics', 'RF electronics, control systems'],
+            'Materials_Supplied': ['Precision electrodes, vacuum chambers', 'Laser diodes, optical components', 'RF generators, control electronics'],
+            'Known_Clients': ['', '', ''],
+            'Applications': ['Ion trapping, qubit control', 'Qubit manipulation, readout', 'Quantum control systems'],
+            'Website': ['', '', ''],
+            'Technical_Specs': ['', '', ''],
+            'Notes': ['Research needed', 'Research needed', 'Research needed']
+        },
+
+        'Software_Companies': {
+            'Software_Name': ['TKET', 'Lambeq', 'PyTket', '[Add New SDK]'],
+            'Company': ['Quantinuum', 'Quantinuum', 'Quantinuum', ''],
+            'Type': ['Compiler', 'Framework', 'SDK', ''],
+            'Programming_Languages': ['Hardware-agnostic', 'Python', 'Python', ''],
+            'Supported_Hardware': ['Multiple platforms', 'NLP applications', 'Quantinuum systems', ''],
+            'License': ['Commercial', 'Open Source', 'Open Source', ''],
+            'Website': ['https://tket.quantinuum.com', 'https://lambeq.com', 'https://pytket.com', ''],
+            'Github': ['', 'https://github.com/CQCL/lambeq', 'https://github.com/CQCL/pytket', ''],
+            'Description': ['Hardware-agnostic quantum compiler', 'Quantum NLP framework', 'Python quantum development', ''],
+            'Notes': ['Cross-platform optimization', 'Natural language processing', 'Quantinuum ecosystem', '']
+        }
+    }
+
+    photonic_template = {
+        'Hardware_Companies': {
+            'Company_Name': ['Xanadu', 'PsiQuantum', 'Orca Computing', '[Add New Company]'],
+            'Country': ['Canada', 'USA', 'UK', ''],
+            'Modality': ['PhotonicQuantum', 'PhotonicQuantum', 'PhotonicQuantum', 'PhotonicQuantum'],
+            'Qubit_Count': [216, 1000000, 8, ''],
+            'Cloud_Service': ['Yes', 'No', 'Yes', ''],
+            'Platform_Name': ['X-Series', 'Fault-tolerant system', 'PT-1', ''],
+            'Website': ['https://xanadu.ai', 'https://psiquantum.com', 'https://orcacomputing.com', ''],
+            'Founded_Year': [2016, 2016, 2019, ''],
+            'Description': ['Photonic quantum computing', 'Million-qubit photonic computer', 'Quantum photonic processors', ''],
+            'Notes': ['Continuous variable approach', 'Fault-tolerant focus', 'Near-term photonic systems', '']
+        },
+
+        'Component_Suppliers': {
+            'Supplier_Name': ['[Add Photonic Suppliers]', '[Add Laser Suppliers]', '[Add Detector Suppliers]'],
+            'Country': ['', '', ''],
+            'Component_Types': ['Photonic chips, waveguides', 'Laser sources', 'Single photon detectors'],
+            'Materials_Supplied': ['Silicon photonics, integrated optics', 'Laser diodes, coherent sources', 'SNSPDs, avalanche photodiodes'],
+            'Known_Clients': ['', '', ''],
+            'Applications': ['Quantum photonic circuits', 'Photon generation', 'Quantum measurement'],
+            'Website': ['', '', ''],
+            'Technical_Specs': ['', '', ''],
+            'Notes': ['Research needed', 'Research needed', 'Research needed']
+        },
+
+        'Software_Companies': {
+            'Software_Name': ['PennyLane', 'Strawberry Fields', 'Perceval', '[Add New SDK]'],
+            'Company': ['Xanadu', 'Xanadu', 'Quandela', ''],
+            'Type': ['Framework', 'SDK', 'SDK', ''],
+            'Programming_Languages': ['Python', 'Python', 'Python', ''],
+            'Supported_Hardware': ['Multiple platforms', 'Xanadu hardware', 'Photonic systems', ''],
+            'License': ['Open Source', 'Open Source', 'Open Source', ''],
+            'Website': ['https://pennylane.ai', 'https://strawberryfields.ai', 'https://perceval.quandela.net', ''],
+            'Github': ['https://github.com/PennyLaneAI', 'https://github.com/XanaduAI', 'https://github.com/Quandela', ''],
+            'Description': ['Quantum ML framework', 'Photonic quantum computing', 'Photonic quantum computing', ''],
+            'Notes': ['Cross-platform ML focus', 'Continuous variable systems', 'French photonic company', '']
+        }
+    }
+
+    generic_template = {
+        'Hardware_Companies': {
+            'Company_Name': ['[Company 1]', '[Company 2]', '[Add More]'],
+            'Country': ['USA', 'Europe', ''],
+            'Modality': ['[YourModalityHere]', '[YourModalityHere]', '[YourModalityHere]'],
+            'Qubit_Count': ['', '', ''],
+            'Cloud_Service': ['Yes/No', 'Yes/No', ''],
+            'Platform_Name': ['', '', ''],
+            'Website': ['', '', ''],
+            'Founded_Year': ['', '', ''],
+            'Description': ['', '', ''],
+            'Notes': ['', '', '']
+        },
+
+        'Component_Suppliers': {
+            'Supplier_Name': ['[Supplier 1]', '[Supplier 2]', '[Add More]'],
+            'Country': ['', '', ''],
+            'Component_Types': ['[Component type]', '[Component type]', ''],
+            'Materials_Supplied': ['[Materials]', '[Materials]', ''],
+            'Known_Clients': ['[Client 1, Client 2]', '[Client 1, Client 2]', ''],
+            'Applications': ['[Applications]', '[Applications]', ''],
+            'Website': ['', '', ''],
+            'Technical_Specs': ['[Specifications]', '[Specifications]', ''],
+            'Notes': ['[Additional info]', '[Additional info]', '']
+        },
+
+        'Software_Companies': {
+            'Software_Name': ['[SDK/Platform 1]', '[SDK/Platform 2]', '[Add More]'],
+            'Company': ['[Company]', '[Company]', ''],
+            'Type': ['SDK/Platform/Framework', 'SDK/Platform/Framework', ''],
+            'Programming_Languages': ['Python/C++/Other', 'Python/C++/Other', ''],
+            'Supported_Hardware': ['[Hardware platforms]', '[Hardware platforms]', ''],
+            'License': ['Open Source/Commercial', 'Open Source/Commercial', ''],
+            'Website': ['', '', ''],
+            'Github': ['', '', ''],
+            'Description': ['[Description]', '[Description]', ''],
+            'Notes': ['[Additional info]', '[Additional info]', '']
+        }
+    }
+
+    return {
+        'superconducting': ('Superconducting_Supply_Chain.xlsx', superconducting_template),
+        'trapped_ion': ('TrappedIon_Supply_Chain.xlsx', trapped_ion_template),
+        'photonic': ('Photonic_Supply_Chain.xlsx', photonic_template),
+        'generic': ('Generic_Modality_Template.xlsx', generic_template),
+    }
+
+def _sheet_rows(columns):
+    """Turn a {column: [values]} dict into header + data rows of strings"""
+    return [list(columns)] + [[str(v) for v in row] for row in zip(*columns.values())]
+
+def _col_letter(index):
+    """0-based column index -> spreadsheet column letters (0 -> A)"""
+    letters = ''
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+def _write_xlsx_direct(path, sheets):
+    """Write an .xlsx workbook directly, without pandas or openpyxl.
+
+    An .xlsx file is just a zip of XML parts. For small static string
+    templates, emitting the worksheet XML and a sharedStrings table
+    ourselves skips DataFrame construction and the openpyxl cell-object
+    tree entirely. ``sheets`` maps sheet name -> list of rows, each row
+    a list of strings.
+    """
+    ns = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    rel_ns = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+    # Shared string table: every cell stores an index into this list
+    string_ids = {}
+    def _sid(value):
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(string_ids)
+        return sid
+
+    sheet_xmls = []
+    for rows in sheets.values():
+        parts = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                 f'<worksheet xmlns="{ns}"><sheetData>']
+        for r, row in enumerate(rows, 1):
+            cells = ''.join(
+                f'<c r="{_col_letter(c)}{r}" t="s"><v>{_sid(value)}</v></c>'
+                for c, value in enumerate(row)
+            )
+            parts.append(f'<row r="{r}">{cells}</row>')
+        parts.append('</sheetData></worksheet>')
+        sheet_xmls.append(''.join(parts))
+
+    sheet_tags = ''.join(
+        f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+        for i, name in enumerate(sheets, 1)
+    )
+    workbook = (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                f'<workbook xmlns="{ns}" xmlns:r="{rel_ns}">'
+                f'<sheets>{sheet_tags}</sheets></workbook>')
+
+    n = len(sheets)
+    workbook_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + ''.join(
+            f'<Relationship Id="rId{i}" Type="{rel_ns}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, n + 1)
+        )
+        + f'<Relationship Id="rId{n + 1}" Type="{rel_ns}/sharedStrings" Target="sharedStrings.xml"/>'
+        '</Relationships>'
+    )
+
+    root_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{rel_ns}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    )
+
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+        + ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, n + 1)
+        )
+        + '</Types>'
+    )
+
+    shared_strings = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<sst xmlns="{ns}" uniqueCount="{len(string_ids)}">'
+        + ''.join(f'<si><t xml:space="preserve">{escape(s)}</t></si>' for s in string_ids)
+        + '</sst>'
+    )
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', content_types)
+        zf.writestr('_rels/.rels', root_rels)
+        zf.writestr('xl/workbook.xml', workbook)
+        zf.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+        zf.writestr('xl/sharedStrings.xml', shared_strings)
+        for i, xml in enumerate(sheet_xmls, 1):
+            zf.writestr(f'xl/worksheets/sheet{i}.xml', xml)
 
 class ExcelSupplyChainManager:
     """Manager for Excel-based supply chain data updates"""
@@ -22,215 +328,62 @@ class ExcelSupplyChainManager:
         self.base_path = Path(base_path) if base_path else Path("/home/liuyiwen/AI/AI Agent/quantum_news_agent/project/ontology")
         self.templates_path = self.base_path / "excel_templates"
         self.templates_path.mkdir(exist_ok=True)
+        # Ontology built lazily on first sync and reused afterwards
+        self._ontology: Optional[QuantumSupplyChainOntology] = None
+        # Parsed workbooks keyed by path, invalidated by mtime, so a
+        # validate-then-sync sequence parses each .xlsx once
+        self._sheet_cache: Dict[Path, Tuple[float, Dict[str, pd.DataFrame]]] = {}
 
     def create_excel_templates(self):
-        """Create Excel templates for different quantum modalities"""
-
-        # Template for Superconducting companies (based on existing data)
-        superconducting_template = {
-            'Hardware_Companies': pd.DataFrame({
-                'Company_Name': ['IBM Quantum', 'Google Quantum AI', 'Rigetti Computing', '[Add New Company]'],
-                'Country': ['USA', 'USA', 'USA', ''],
-                'Modality': ['SuperconductingQubit', 'SuperconductingQubit', 'SuperconductingQubit', 'SuperconductingQubit'],
-                'Qubit_Count': [1000, 70, 80, ''],
-                'Cloud_Service': ['Yes', 'Yes', 'Yes', ''],
-                'Platform_Name': ['IBM Quantum Network', 'Google Quantum AI', 'Quantum Cloud Services', ''],
-                'Website': ['https://quantum.ibm.com', 'https://quantumai.google', 'https://rigetti.com', ''],
-                'Founded_Year': [1911, 1998, 2013, ''],
-                'Description': ['Leading quantum computing platform', 'Quantum AI research and platforms', 'Full-stack quantum computing', ''],
-                'Notes': ['', '', '', '']
-            }),
-
-            'Component_Suppliers': pd.DataFrame({
-                'Supplier_Name': ['Super Conductor Materials Inc.', 'Sumitomo Electric Industries', 'SuperPower Inc.', '[Add New Supplier]'],
-                'Country': ['USA', 'Japan', 'USA', ''],
-                'Component_Types': ['Sputtering targets, thin-film superconductors', 'HTS wire', 'HTS tape, high-field magnets', ''],
-                'Materials_Supplied': ['NbTi, Nb₃Sn, superconducting films', 'HTS wire, Nb₃Sn', 'YBCO tape, superconducting wire', ''],
-                'Known_Clients': ['IBM, Google, Rigetti', 'Pasqal, Japanese labs', 'Tokamak Energy, DOE labs', ''],
-                'Applications': ['Quantum chips, thin films', 'Quantum logistics, magnets', 'High-field systems, cryogenics', ''],
-                'Website': ['https://scmat.com', 'https://global-sei.com', 'https://superpower-inc.com', ''],
-                'Technical_Specs': ['Sputtering targets for qubits', 'HTS wire optimization', 'High current capacity', ''],
-                'Notes': ['Primary supplier for IBM/Google', 'Partnership with Pasqal', '$80M DOE support', '']
-            }),
-
-            'Software_Companies': pd.DataFrame({
-                'Software_Name': ['Qiskit', 'Cirq', 'Forest SDK', '[Add New SDK]'],
-                'Company': ['IBM', 'Google', 'Rigetti', ''],
-                'Type': ['SDK', 'SDK', 'SDK', 'SDK/Platform/Framework'],
-                'Programming_Languages': ['Python', 'Python', 'Python', ''],
-                'Supported_Hardware': ['IBM Quantum', 'Google quantum processors', 'Rigetti systems', ''],
-                'License': ['Open Source', 'Open Source', 'Open Source', ''],
-                'Website': ['https://qiskit.org', 'https://quantumai.google/cirq', 'https://rigetti.com/forest', ''],
-                'Github': ['https://github.com/Qiskit', 'https://github.com/quantumlib/Cirq', 'https://github.com/rigetti', ''],
-                'Description': ['Open-source quantum computing SDK', 'Python framework for quantum circuits', 'Quantum-classical hybrid computing', ''],
-                'Notes': ['Most popular quantum SDK', 'Focus on Google hardware', 'Hybrid workflows', '']
-            })
-        }
-
-        # Create Excel file for Superconducting modality
-        superconducting_file = self.templates_path / "Superconducting_Supply_Chain.xlsx"
-        with pd.ExcelWriter(superconducting_file, engine='openpyxl') as writer:
-            for sheet_name, df in superconducting_template.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        logging.info(f"✅ Created Superconducting template: {superconducting_file}")
-
-        # Template for Trapped Ion companies
-        trapped_ion_template = {
-            'Hardware_Companies': pd.DataFrame({
-                'Company_Name': ['IonQ', 'Quantinuum (Honeywell)', 'Alpine Quantum Technologies', '[Add New Company]'],
-                'Country': ['USA', 'USA', 'Austria', ''],
-                'Modality': ['TrappedIon', 'TrappedIon', 'TrappedIon', 'TrappedIon'],
-                'Qubit_Count': [64, 56, 24, ''],
-                'Cloud_Service': ['Yes', 'Yes', 'No', ''],
-                'Platform_Name': ['IonQ Aria', 'H-Series', 'AQT Platform', ''],
-                'Website': ['https://ionq.com', 'https://quantinuum.com', 'https://aqt.eu', ''],
-                'Founded_Year': [2015, 2021, 2018, ''],
-                'Description': ['Trapped ion quantum computing leader', 'Quantum computing and software', 'Trapped ion quantum systems', ''],
-                'Notes': ['Public company (NYSE: IONQ)', 'Honeywell + Cambridge Quantum merger', 'European trapped ion leader', '']
-            }),
-
-            'Component_Suppliers': pd.DataFrame({
-                'Supplier_Name': ['[Add Ion Trap Suppliers]', '[Add Laser Suppliers]', '[Add Electronics Suppliers]'],
-                'Country': ['', '', ''],
-                'Component_Types': ['Ion traps, electrodes', 'Laser systems, optics', 'RF electronics, control systems'],
-                'Materials_Supplied': ['Precision electrodes, vacuum chambers', 'Laser diodes, optical components', 'RF generators, control electronics'],
-                'Known_Clients': ['', '', ''],
-                'Applications': ['Ion trapping, qubit control', 'Qubit manipulation, readout', 'Quantum control systems'],
-                'Website': ['', '', ''],
-                'Technical_Specs': ['', '', ''],
-                'Notes': ['Research needed', 'Research needed', 'Research needed']
-            }),
-
-            'Software_Companies': pd.DataFrame({
-                'Software_Name': ['TKET', 'Lambeq', 'PyTket', '[Add New SDK]'],
-                'Company': ['Quantinuum', 'Quantinuum', 'Quantinuum', ''],
-                'Type': ['Compiler', 'Framework', 'SDK', ''],
-                'Programming_Languages': ['Hardware-agnostic', 'Python', 'Python', ''],
-                'Supported_Hardware': ['Multiple platforms', 'NLP applications', 'Quantinuum systems', ''],
-                'License': ['Commercial', 'Open Source', 'Open Source', ''],
-                'Website': ['https://tket.quantinuum.com', 'https://lambeq.com', 'https://pytket.com', ''],
-                'Github': ['', 'https://github.com/CQCL/lambeq', 'https://github.com/CQCL/pytket', ''],
-                'Description': ['Hardware-agnostic quantum compiler', 'Quantum NLP framework', 'Python quantum development', ''],
-                'Notes': ['Cross-platform optimization', 'Natural language processing', 'Quantinuum ecosystem', '']
-            })
-        }
-
-        # Create Excel file for Trapped Ion modality
-        trapped_ion_file = self.templates_path / "TrappedIon_Supply_Chain.xlsx"
-        with pd.ExcelWriter(trapped_ion_file, engine='openpyxl') as writer:
-            for sheet_name, df in trapped_ion_template.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        logging.info(f"✅ Created Trapped Ion template: {trapped_ion_file}")
-
-        # Template for Photonic companies
-        photonic_template = {
-            'Hardware_Companies': pd.DataFrame({
-                'Company_Name': ['Xanadu', 'PsiQuantum', 'Orca Computing', '[Add New Company]'],
-                'Country': ['Canada', 'USA', 'UK', ''],
-                'Modality': ['PhotonicQuantum', 'PhotonicQuantum', 'PhotonicQuantum', 'PhotonicQuantum'],
-                'Qubit_Count': [216, 1000000, 8, ''],
-                'Cloud_Service': ['Yes', 'No', 'Yes', ''],
-                'Platform_Name': ['X-Series', 'Fault-tolerant system', 'PT-1', ''],
-                'Website': ['https://xanadu.ai', 'https://psiquantum.com', 'https://orcacomputing.com', ''],
-                'Founded_Year': [2016, 2016, 2019, ''],
-                'Description': ['Photonic quantum computing', 'Million-qubit photonic computer', 'Quantum photonic processors', ''],
-                'Notes': ['Continuous variable approach', 'Fault-tolerant focus', 'Near-term photonic systems', '']
-            }),
-
-            'Component_Suppliers': pd.DataFrame({
-                'Supplier_Name': ['[Add Photonic Suppliers]', '[Add Laser Suppliers]', '[Add Detector Suppliers]'],
-                'Country': ['', '', ''],
-                'Component_Types': ['Photonic chips, waveguides', 'Laser sources', 'Single photon detectors'],
-                'Materials_Supplied': ['Silicon photonics, integrated optics', 'Laser diodes, coherent sources', 'SNSPDs, avalanche photodiodes'],
-                'Known_Clients': ['', '', ''],
-                'Applications': ['Quantum photonic circuits', 'Photon generation', 'Quantum measurement'],
-                'Website': ['', '', ''],
-                'Technical_Specs': ['', '', ''],
-                'Notes': ['Research needed', 'Research needed', 'Research needed']
-            }),
-
-            'Software_Companies': pd.DataFrame({
-                'Software_Name': ['PennyLane', 'Strawberry Fields', 'Perceval', '[Add New SDK]'],
-                'Company': ['Xanadu', 'Xanadu', 'Quandela', ''],
-                'Type': ['Framework', 'SDK', 'SDK', ''],
-                'Programming_Languages': ['Python', 'Python', 'Python', ''],
-                'Supported_Hardware': ['Multiple platforms', 'Xanadu hardware', 'Photonic systems', ''],
-                'License': ['Open Source', 'Open Source', 'Open Source', ''],
-                'Website': ['https://pennylane.ai', 'https://strawberryfields.ai', 'https://perceval.quandela.net', ''],
-                'Github': ['https://github.com/PennyLaneAI', 'https://github.com/XanaduAI', 'https://github.com/Quandela', ''],
-                'Description': ['Quantum ML framework', 'Photonic quantum computing', 'Photonic quantum computing', ''],
-                'Notes': ['Cross-platform ML focus', 'Continuous variable systems', 'French photonic company', '']
-            })
-        }
-
-        # Create Excel file for Photonic modality
-        photonic_file = self.templates_path / "Photonic_Supply_Chain.xlsx"
-        with pd.ExcelWriter(photonic_file, engine='openpyxl') as writer:
-            for sheet_name, df in photonic_template.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        logging.info(f"✅ Created Photonic template: {photonic_file}")
-
-        # Create a generic template for new modalities
-        generic_template = {
-            'Hardware_Companies': pd.DataFrame({
-                'Company_Name': ['[Company 1]', '[Company 2]', '[Add More]'],
-                'Country': ['USA', 'Europe', ''],
-                'Modality': ['[YourModalityHere]', '[YourModalityHere]', '[YourModalityHere]'],
-                'Qubit_Count': ['', '', ''],
-                'Cloud_Service': ['Yes/No', 'Yes/No', ''],
-                'Platform_Name': ['', '', ''],
-                'Website': ['', '', ''],
-                'Founded_Year': ['', '', ''],
-                'Description': ['', '', ''],
-                'Notes': ['', '', '']
-            }),
-
-            'Component_Suppliers': pd.DataFrame({
-                'Supplier_Name': ['[Supplier 1]', '[Supplier 2]', '[Add More]'],
-                'Country': ['', '', ''],
-                'Component_Types': ['[Component type]', '[Component type]', ''],
-                'Materials_Supplied': ['[Materials]', '[Materials]', ''],
-                'Known_Clients': ['[Client 1, Client 2]', '[Client 1, Client 2]', ''],
-                'Applications': ['[Applications]', '[Applications]', ''],
-                'Website': ['', '', ''],
-                'Technical_Specs': ['[Specifications]', '[Specifications]', ''],
-                'Notes': ['[Additional info]', '[Additional info]', '']
-            }),
-
-            'Software_Companies': pd.DataFrame({
-                'Software_Name': ['[SDK/Platform 1]', '[SDK/Platform 2]', '[Add More]'],
-                'Company': ['[Company]', '[Company]', ''],
-                'Type': ['SDK/Platform/Framework', 'SDK/Platform/Framework', ''],
-                'Programming_Languages': ['Python/C++/Other', 'Python/C++/Other', ''],
-                'Supported_Hardware': ['[Hardware platforms]', '[Hardware platforms]', ''],
-                'License': ['Open Source/Commercial', 'Open Source/Commercial', ''],
-                'Website': ['', '', ''],
-                'Github': ['', '', ''],
-                'Description': ['[Description]', '[Description]', ''],
-                'Notes': ['[Additional info]', '[Additional info]', '']
-            })
-        }
+        """Create Excel templates for different quantum modalities
 
-        # Create generic template
-        generic_file = self.templates_path / "Generic_Modality_Template.xlsx"
-        with pd.ExcelWriter(generic_file, engine='openpyxl') as writer:
-            for sheet_name, df in generic_template.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        logging.info(f"✅ Created Generic template: {generic_file}")
+        Unchanged templates are skipped via a content-hash sidecar next
+        to each .xlsx, so warm re-runs cost an os.stat and a hash
+        compare instead of a workbook rewrite.
+        """
+        template_files = {}
+        pending = []
+        # The templates are independent and most of the write cost is
+        # zip compression, which releases the GIL, so stale ones are
+        # rebuilt in parallel
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for key, (filename, sheets) in _build_templates().items():
+                template_path = self.templates_path / filename
+                digest = self._template_hash(sheets)
+                hash_file = template_path.with_suffix('.xlsx.hash')
+                template_files[key] = template_path
+
+                if (template_path.exists() and hash_file.exists()
+                        and hash_file.read_text() == digest):
+                    logger.info(f"✅ Template up to date: {template_path}")
+                    continue
+
+                pending.append(pool.submit(
+                    self._write_template, template_path, hash_file, digest, sheets))
+
+            for future in pending:
+                future.result()
 
         # Create instructions file
         self.create_instructions_file()
 
-        return {
-            'superconducting': superconducting_file,
-            'trapped_ion': trapped_ion_file,
-            'photonic': photonic_file,
-            'generic': generic_file
-        }
+        return template_files
+
+    def _write_template(self, template_path, hash_file, digest, sheets):
+        """Write one template workbook and its hash sidecar"""
+        _write_xlsx_direct(template_path, {
+            name: _sheet_rows(columns) for name, columns in sheets.items()
+        })
+        hash_file.write_text(digest)
+        logger.info(f"✅ Created template: {template_path}")
+
+    def _template_hash(self, sheets):
+        """Stable digest of a template's sheets for change detection"""
+        h = hashlib.blake2b()
+        for sheet_name, columns in sheets.items():
+            h.update(sheet_name.encode('utf-8'))
+            h.update(repr(columns).encode('utf-8'))
+        return h.hexdigest()
 
     def create_instructions_file(self):
         """Create instructions for using Excel templates"""
@@ -322,10 +475,11 @@ manager.sync_excel_to_ontology("Superconducting_Supply_Chain.xlsx", "Superconduc
 """
 
         instructions_file = self.templates_path / "Excel_Update_Instructions.md"
-        with open(instructions_file, 'w') as f:
-            f.write(instructions)
+        # Single C-level write with an explicit encoding, so the output
+        # does not depend on the platform locale
+        instructions_file.write_text(instructions, encoding='utf-8')
 
-        logging.info(f"✅ Created instructions: {instructions_file}")
+        logger.info(f"✅ Created instructions: {instructions_file}")
 
     def sync_excel_to_ontology(self, excel_file: str, modality: str) -> Dict:
         """
@@ -343,62 +497,58 @@ manager.sync_excel_to_ontology("Superconducting_Supply_Chain.xlsx", "Superconduc
             if not excel_path.exists():
                 raise FileNotFoundError(f"Excel file not found: {excel_path}")
 
+            # One shared string for the modality across every record
+            modality = sys.intern(modality)
+
             # Read all sheets
-            sheets = pd.read_excel(excel_path, sheet_name=None, engine='openpyxl')
+            sheets = self._read_workbook(excel_path)
+
+            # One clock read per sync; every row and the backup share it
+            now = datetime.now()
+            now_iso = now.isoformat()
+
+            hardware = self._hardware_records(sheets.get('Hardware_Companies'), modality, now_iso)
+            suppliers = self._supplier_records(sheets.get('Component_Suppliers'), modality, now_iso)
+            software = self._software_records(sheets.get('Software_Companies'), modality, now_iso)
+
+            companies_data = hardware + suppliers + software
+            stats = {
+                'hardware': len(hardware),
+                'suppliers': len(suppliers),
+                'software': len(software),
+                'total': len(companies_data),
+            }
 
-            companies_data = []
-            stats = {'hardware': 0, 'suppliers': 0, 'software': 0, 'total': 0}
-
-            # Process Hardware Companies
-            if 'Hardware_Companies' in sheets:
-                hw_df = sheets['Hardware_Companies']
-                for _, row in hw_df.iterrows():
-                    company_name = str(row.get('Company_Name', '')).strip()
-                    if company_name and not company_name.startswith('[') and company_name != 'nan':
-                        company_data = self._process_hardware_company(row, modality)
-                        companies_data.append(company_data)
-                        stats['hardware'] += 1
-
-            # Process Component Suppliers
-            if 'Component_Suppliers' in sheets:
-                supplier_df = sheets['Component_Suppliers']
-                for _, row in supplier_df.iterrows():
-                    supplier_name = str(row.get('Supplier_Name', '')).strip()
-                    if supplier_name and not supplier_name.startswith('[') and supplier_name != 'nan':
-                        supplier_data = self._process_component_supplier(row, modality)
-                        companies_data.append(supplier_data)
-                        stats['suppliers'] += 1
-
-            # Process Software Companies
-            if 'Software_Companies' in sheets:
-                sw_df = sheets['Software_Companies']
-                for _, row in sw_df.iterrows():
-                    software_name = str(row.get('Software_Name', '')).strip()
-                    if software_name and not software_name.startswith('[') and software_name != 'nan':
-                        software_data = self._process_software_company(row, modality)
-                        companies_data.append(software_data)
-                        stats['software'] += 1
-
-            stats['total'] = len(companies_data)
-
-            # Update ontology if there's data
+            # Update ontology if there's data; build_ontology only runs on
+            # the first sync, later calls reuse the cached instance but
+            # still persist before reporting success
             if companies_data:
-                ontology = QuantumSupplyChainOntology(self.base_path)
-                ontology.build_ontology()
-                ontology.add_new_modality_data(modality, companies_data)
-                ontology.save_ontology()
+                if self._ontology is None:
+                    self._ontology = QuantumSupplyChainOntology(self.base_path)
+                    self._ontology.build_ontology()
+                self._ontology.add_new_modality_data(modality, companies_data)
+                self._ontology.save_ontology()
 
-                logging.info(f"✅ Synced {stats['total']} companies to ontology for {modality}")
+                logger.info(f"✅ Synced {stats['total']} companies to ontology for {modality}")
 
             # Save processed data as JSON for backup
-            backup_file = self.base_path / f"{modality}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(backup_file, 'w') as f:
-                json.dump({
-                    'modality': modality,
-                    'companies': companies_data,
-                    'stats': stats,
-                    'sync_time': datetime.now().isoformat()
-                }, f, indent=2, default=str)
+            backup_file = self.base_path / f"{modality}_backup_{now.strftime('%Y%m%d_%H%M%S')}.json"
+            payload = {
+                'modality': modality,
+                'companies': companies_data,
+                'stats': stats,
+                'sync_time': now_iso
+            }
+            # 256 KiB buffer: backups grow to megabyte scale, and the
+            # default 8 KiB buffer costs one write syscall per 8 KiB
+            if orjson is not None:
+                with open(backup_file, 'wb', buffering=1 << 18) as f:
+                    f.write(orjson.dumps(
+                        payload, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(backup_file, 'w', buffering=1 << 18) as f:
+                    json.dump(payload, f, indent=2, default=str)
 
             return {
                 'success': True,
@@ -408,80 +558,143 @@ manager.sync_excel_to_ontology("Superconducting_Supply_Chain.xlsx", "Superconduc
             }
 
         except Exception as e:
-            logging.error(f"Error syncing Excel to ontology: {e}")
+            logger.error(f"Error syncing Excel to ontology: {e}")
             return {
                 'success': False,
                 'error': str(e),
                 'modality': modality
             }
 
-    def _process_hardware_company(self, row: pd.Series, modality: str) -> Dict:
-        """Process hardware company row from Excel"""
-        return {
-            'name': str(row.get('Company_Name', '')).strip(),
-            'type': 'hardware',
-            'country': str(row.get('Country', '')).strip(),
-            'modalities': [modality],
-            'description': str(row.get('Description', '')).strip(),
-            'website': str(row.get('Website', '')).strip(),
-            'founded_year': self._safe_int(row.get('Founded_Year')),
-            'qubit_count': self._safe_int(row.get('Qubit_Count')),
-            'cloud_service': str(row.get('Cloud_Service', '')).strip().lower() == 'yes',
-            'platforms': [str(row.get('Platform_Name', '')).strip()] if row.get('Platform_Name') else [],
-            'notes': str(row.get('Notes', '')).strip(),
-            'last_updated': datetime.now().isoformat(),
-            'data_source': 'Excel update'
-        }
-
-    def _process_component_supplier(self, row: pd.Series, modality: str) -> Dict:
-        """Process component supplier row from Excel"""
-        return {
-            'name': str(row.get('Supplier_Name', '')).strip(),
-            'type': 'supplier',
-            'country': str(row.get('Country', '')).strip(),
-            'component_types': str(row.get('Component_Types', '')).strip(),
-            'materials_supplied': str(row.get('Materials_Supplied', '')).strip(),
-            'clients': [c.strip() for c in str(row.get('Known_Clients', '')).split(',') if c.strip()],
-            'applications': str(row.get('Applications', '')).strip(),
-            'website': str(row.get('Website', '')).strip(),
-            'technical_specs': str(row.get('Technical_Specs', '')).strip(),
-            'notes': str(row.get('Notes', '')).strip(),
-            'last_updated': datetime.now().isoformat(),
-            'data_source': 'Excel update'
-        }
+    def _read_workbook(self, excel_path: Path) -> Dict[str, pd.DataFrame]:
+        """Read every sheet of a workbook into DataFrames.
 
-    def _process_software_company(self, row: pd.Series, modality: str) -> Dict:
-        """Process software company row from Excel"""
-        return {
-            'name': str(row.get('Software_Name', '')).strip(),
-            'type': 'software',
-            'company': str(row.get('Company', '')).strip(),
-            'product_type': str(row.get('Type', '')).strip(),
-            'programming_languages': [l.strip() for l in str(row.get('Programming_Languages', '')).split(',') if l.strip()],
-            'supported_hardware': [h.strip() for h in str(row.get('Supported_Hardware', '')).split(',') if h.strip()],
-            'license': str(row.get('License', '')).strip(),
-            'website': str(row.get('Website', '')).strip(),
-            'github': str(row.get('Github', '')).strip(),
-            'description': str(row.get('Description', '')).strip(),
-            'notes': str(row.get('Notes', '')).strip(),
-            'last_updated': datetime.now().isoformat(),
-            'data_source': 'Excel update'
-        }
+        Results are cached per path and invalidated when the file's
+        mtime changes, so validate followed by sync parses the workbook
+        once. Prefers the Rust-based calamine engine, which parses
+        .xlsx severalfold faster than openpyxl; falls back to openpyxl
+        when python-calamine is not installed.
+        """
+        mtime = os.path.getmtime(excel_path)
+        cached = self._sheet_cache.get(excel_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-    def _safe_int(self, value) -> Optional[int]:
-        """Safely convert value to int"""
         try:
-            if pd.isna(value) or value == '':
-                return None
-            return int(float(value))
-        except (ValueError, TypeError):
-            return None
+            sheets = pd.read_excel(excel_path, sheet_name=None, engine='calamine')
+        except ImportError:
+            sheets = pd.read_excel(excel_path, sheet_name=None, engine='openpyxl')
+        self._sheet_cache[excel_path] = (mtime, sheets)
+        return sheets
+
+    def _sheet_arrays(self, df: Optional[pd.DataFrame], name_col: str,
+                      columns: Tuple[str, ...]) -> Tuple[Dict[str, np.ndarray], int]:
+        """Clean a sheet and return the requested columns as string arrays.
+
+        Structure-of-arrays form: each column is normalized in one
+        vectorized pass (fillna/astype/strip), placeholder and empty
+        rows are dropped with a single boolean mask, and record
+        builders then index the arrays instead of doing per-cell
+        lookups on Series objects. Missing columns come back as empty
+        strings.
+        """
+        if df is None or name_col not in df.columns:
+            return {}, 0
+
+        # Drop placeholder and empty rows on the name column alone, so
+        # the full-frame string conversion below only touches real rows
+        names = df[name_col].fillna('').astype(str).str.strip()
+        df = df.loc[names.ne('') & names.ne('nan') & ~names.str.startswith('[')]
+
+        df = df.fillna('').astype(str).apply(lambda s: s.str.strip())
+
+        n = len(df)
+        empty = np.full(n, '', dtype=object)
+        return {col: df[col].to_numpy() if col in df.columns else empty
+                for col in columns}, n
+
+    @staticmethod
+    def _int_column(values: np.ndarray) -> List[Optional[int]]:
+        """Parse a whole string column to ints; bad cells become None.
+
+        One pd.to_numeric C-level pass replaces the old per-row
+        _safe_int float/int dance.
+        """
+        nums = pd.to_numeric(pd.Series(values), errors='coerce')
+        return [None if pd.isna(v) else int(v) for v in nums]
+
+    def _hardware_records(self, df: Optional[pd.DataFrame], modality: str,
+                          timestamp: str) -> List[Dict]:
+        """Build hardware company records from a cleaned sheet"""
+        cols, n = self._sheet_arrays(df, 'Company_Name', (
+            'Company_Name', 'Country', 'Description', 'Website', 'Founded_Year',
+            'Qubit_Count', 'Cloud_Service', 'Platform_Name', 'Notes'))
+        founded = self._int_column(cols['Founded_Year']) if n else []
+        qubits = self._int_column(cols['Qubit_Count']) if n else []
+        return [{
+            'name': cols['Company_Name'][i],
+            'type': _TYPE_HARDWARE,
+            'country': cols['Country'][i],
+            'modalities': [modality],
+            'description': cols['Description'][i],
+            'website': cols['Website'][i],
+            'founded_year': founded[i],
+            'qubit_count': qubits[i],
+            'cloud_service': cols['Cloud_Service'][i].lower() == 'yes',
+            'platforms': [cols['Platform_Name'][i]] if cols['Platform_Name'][i] else [],
+            'notes': cols['Notes'][i],
+            'last_updated': timestamp,
+            'data_source': _SRC_EXCEL
+        } for i in range(n)]
+
+    def _supplier_records(self, df: Optional[pd.DataFrame], modality: str,
+                          timestamp: str) -> List[Dict]:
+        """Build component supplier records from a cleaned sheet"""
+        cols, n = self._sheet_arrays(df, 'Supplier_Name', (
+            'Supplier_Name', 'Country', 'Component_Types', 'Materials_Supplied',
+            'Known_Clients', 'Applications', 'Website', 'Technical_Specs', 'Notes'))
+        return [{
+            'name': cols['Supplier_Name'][i],
+            'type': _TYPE_SUPPLIER,
+            'country': cols['Country'][i],
+            'component_types': cols['Component_Types'][i],
+            'materials_supplied': cols['Materials_Supplied'][i],
+            'clients': list(_split_csv(cols['Known_Clients'][i])),
+            'applications': cols['Applications'][i],
+            'website': cols['Website'][i],
+            'technical_specs': cols['Technical_Specs'][i],
+            'notes': cols['Notes'][i],
+            'last_updated': timestamp,
+            'data_source': _SRC_EXCEL
+        } for i in range(n)]
+
+    def _software_records(self, df: Optional[pd.DataFrame], modality: str,
+                          timestamp: str) -> List[Dict]:
+        """Build software company records from a cleaned sheet"""
+        cols, n = self._sheet_arrays(df, 'Software_Name', (
+            'Software_Name', 'Company', 'Type', 'Programming_Languages',
+            'Supported_Hardware', 'License', 'Website', 'Github',
+            'Description', 'Notes'))
+        return [{
+            'name': cols['Software_Name'][i],
+            'type': _TYPE_SOFTWARE,
+            'company': cols['Company'][i],
+            'product_type': cols['Type'][i],
+            'programming_languages': list(_split_csv(cols['Programming_Languages'][i])),
+            'supported_hardware': list(_split_csv(cols['Supported_Hardware'][i])),
+            'license': cols['License'][i],
+            'website': cols['Website'][i],
+            'github': cols['Github'][i],
+            'description': cols['Description'][i],
+            'notes': cols['Notes'][i],
+            'last_updated': timestamp,
+            'data_source': _SRC_EXCEL
+        } for i in range(n)]
 
     def validate_excel_file(self, excel_file: str) -> Dict:
         """Validate Excel file structure and data quality"""
         try:
             excel_path = self.templates_path / excel_file
-            sheets = pd.read_excel(excel_path, sheet_name=None, engine='openpyxl')
+            sheets = self._read_workbook(excel_path)
 
             validation_results = {
                 'valid': True,
@@ -536,43 +749,47 @@ manager.sync_excel_to_ontology("Superconducting_Supply_Chain.xlsx", "Superconduc
                 if col not in df.columns:
                     validation['errors'].append(f"{sheet_name}: Missing required column '{col}'")
 
-        # Count valid rows (non-placeholder)
-        valid_rows = 0
-        empty_rows = 0
-        placeholder_rows = 0
-
-        for _, row in df.iterrows():
-            name_col = required_columns.get(sheet_name, ['Company_Name'])[0] if sheet_name in required_columns else df.columns[0]
-            name_value = str(row.get(name_col, '')).strip()
-
-            if not name_value or name_value == 'nan':
-                empty_rows += 1
-            elif name_value.startswith('[') and name_value.endswith(']'):
-                placeholder_rows += 1
-            else:
-                valid_rows += 1
-
-                # Validate specific fields
-                if sheet_name == 'Hardware_Companies':
-                    if not str(row.get('Country', '')).strip():
-                        validation['warnings'].append(f"Hardware company '{name_value}' missing country")
-                elif sheet_name == 'Component_Suppliers':
-                    if not str(row.get('Component_Types', '')).strip():
-                        validation['warnings'].append(f"Supplier '{name_value}' missing component types")
+        # Classify rows with NumPy string ufuncs instead of iterrows
+        name_col = required_columns.get(sheet_name, ['Company_Name'])[0] if sheet_name in required_columns else df.columns[0]
+        names = np.char.strip(self._column_strings(df, name_col))
+
+        empty = (names == '') | (names == 'nan')
+        placeholder = ~empty & np.char.startswith(names, '[') & np.char.endswith(names, ']')
+        valid = ~empty & ~placeholder
+
+        # Field warnings for valid rows, computed with one mask per field
+        if valid.any():
+            if sheet_name == 'Hardware_Companies':
+                missing = valid & (np.char.strip(self._column_strings(df, 'Country')) == '')
+                validation['warnings'].extend(
+                    f"Hardware company '{name}' missing country" for name in names[missing])
+            elif sheet_name == 'Component_Suppliers':
+                missing = valid & (np.char.strip(self._column_strings(df, 'Component_Types')) == '')
+                validation['warnings'].extend(
+                    f"Supplier '{name}' missing component types" for name in names[missing])
 
         validation['stats'] = {
             'total_rows': len(df),
-            'valid_rows': valid_rows,
-            'empty_rows': empty_rows,
-            'placeholder_rows': placeholder_rows
+            'valid_rows': int(valid.sum()),
+            'empty_rows': int(empty.sum()),
+            'placeholder_rows': int(placeholder.sum())
         }
 
         return validation
 
+    @staticmethod
+    def _column_strings(df: pd.DataFrame, col: str) -> np.ndarray:
+        """A column as a unicode array; missing columns are all-empty"""
+        if col not in df.columns:
+            return np.full(len(df), '', dtype='U1')
+        return df[col].astype(str).to_numpy().astype('U')
+
 def main():
     """Command-line interface for Excel manager"""
     import argparse
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
     parser = argparse.ArgumentParser(description="Excel Supply Chain Manager")
     parser.add_argument("--action", choices=['create-templates', 'sync', 'validate'],
                        required=True, help="Action to perform")
@@ -620,7 +837,7 @@ def main():
 
     except Exception as e:
         print(f"❌ Error: {e}")
-        logging.error(f"CLI Error: {e}")
+        logger.error(f"CLI Error: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,10 +6,28 @@ Easy-to-use interface for updating and querying the ontology
 
 import json
 import logging
+import os
+from collections import defaultdict
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Files above this size are streamed instead of parsed whole; below it
+# the one-shot parse is faster than streaming overhead
+_STREAM_THRESHOLD = 1 << 20
+
 from quantum_supply_chain_ontology import QuantumSupplyChainOntology
 from data_schema import (
     SupplyChainDataManager, CompanyType, QuantumModality,
@@ -18,6 +36,33 @@ from data_schema import (
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+def _write_json(path, obj, default=None):
+    """Serialize obj straight to bytes on disk, orjson when available"""
+    if orjson is not None:
+        Path(path).write_bytes(
+            orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2, default=default)
+
+@lru_cache(maxsize=64)
+def _to_modality(value: str) -> QuantumModality:
+    """Cached string -> QuantumModality coercion"""
+    return QuantumModality(value)
+
+# String values treated as empty during cleanup (None is checked separately
+# since list/set field values are not hashable)
+_SENTINEL_STRS = frozenset({'', 'nan', 'NaN'})
+
+# company_type -> (dataclass, constructor-accepted field names); computed
+# once so record dicts can be filtered instead of tripping TypeError on
+# extra keys
+_COMPANY_TYPES = {
+    'hardware': (HardwareCompany, frozenset(f.name for f in fields(HardwareCompany) if f.init)),
+    'supplier': (ComponentSupplier, frozenset(f.name for f in fields(ComponentSupplier) if f.init)),
+    'software': (SoftwareCompany, frozenset(f.name for f in fields(SoftwareCompany) if f.init)),
+}
+
 class OntologyManager:
     """High-level manager for quantum supply chain ontology operations"""
 
@@ -25,12 +70,55 @@ class OntologyManager:
         self.ontology_path = Path(ontology_path) if ontology_path else Path("/home/liuyiwen/AI/AI Agent/quantum_news_agent/project/ontology")
         self.data_manager = SupplyChainDataManager(data_path or str(self.ontology_path / "supply_chain_data.json"))
         self.ontology = None
+        self._built = False
+        # Mutation counter; get_ontology_stats reuses its last result
+        # until this moves
+        self._version = 0
+        self._stats_cache = (-1, None)
+        # Reusable read buffer for _read_json; grown once to the largest
+        # file seen instead of allocating fresh bytes per load
+        self._read_buf = bytearray(1 << 20)
+
+    def _read_json(self, path):
+        """Parse a JSON file, reusing one read buffer across calls.
+
+        The buffer is kept when its capacity covers the payload and
+        grown otherwise, so bulk-loading dozens of modality files does
+        not allocate a fresh bytes object per file.
+        """
+        with open(path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > len(self._read_buf):
+                self._read_buf = bytearray(size)
+            view = memoryview(self._read_buf)
+            n = 0
+            while n < size:
+                got = f.readinto(view[n:size])
+                if not got:
+                    break
+                n += got
+
+        if orjson is not None:
+            return orjson.loads(view[:n])
+        return json.loads(bytes(view[:n]))
+
+    def _ensure_loaded(self):
+        """Construct the ontology object without the full graph build"""
+        if self.ontology is None:
+            self.ontology = QuantumSupplyChainOntology(self.ontology_path)
+
+    def _ensure_built(self):
+        """Build the ontology graph once, on first use that needs it"""
+        if self._built:
+            return
+        self._ensure_loaded()
+        self.ontology.build_ontology()
+        self._built = True
 
     def load_or_create_ontology(self):
-        """Load existing ontology or create new one"""
+        """Load existing ontology or create new one (idempotent)"""
         try:
-            self.ontology = QuantumSupplyChainOntology(self.ontology_path)
-            self.ontology.build_ontology()
+            self._ensure_built()
             logging.info("✅ Ontology loaded/created successfully")
         except Exception as e:
             logging.error(f"Error loading ontology: {e}")
@@ -45,53 +133,88 @@ class OntologyManager:
             companies_file: Path to JSON file containing company data
         """
         try:
-            with open(companies_file, 'r') as f:
-                companies_data = json.load(f)
-
-            if not self.ontology:
-                self.load_or_create_ontology()
+            self._ensure_built()
 
-            # Add companies to ontology
-            self.ontology.add_new_modality_data(modality, companies_data.get('companies', []))
+            if ijson is not None and os.path.getsize(companies_file) > _STREAM_THRESHOLD:
+                total = self._stream_modality_companies(modality, companies_file)
+            else:
+                companies = self._read_json(companies_file).get('companies', [])
+                self.ontology.add_new_modality_data(modality, companies)
+                total = len(companies)
 
             # Save updated ontology
             self.ontology.save_ontology()
+            self._version += 1
 
-            logging.info(f"✅ Added {len(companies_data.get('companies', []))} companies for {modality} modality")
+            logging.info(f"✅ Added {total} companies for {modality} modality")
 
         except Exception as e:
             logging.error(f"Error adding modality companies: {e}")
             raise
 
+    def _stream_modality_companies(self, modality: str, companies_file: str,
+                                   batch_size: int = 256) -> int:
+        """Stream companies out of a large file in fixed-size batches.
+
+        ijson yields one company dict at a time, so only batch_size
+        records are materialized at once instead of the whole document
+        plus its companies list.
+        """
+        total = 0
+        batch = []
+        with open(companies_file, 'rb') as f:
+            for company in ijson.items(f, 'companies.item'):
+                batch.append(company)
+                if len(batch) >= batch_size:
+                    self.ontology.add_new_modality_data(modality, batch)
+                    total += len(batch)
+                    batch = []
+        if batch:
+            self.ontology.add_new_modality_data(modality, batch)
+            total += len(batch)
+        return total
+
     def update_superconducting_data(self, new_companies: List[Dict]):
         """Update superconducting modality with new companies"""
         return self.add_modality_companies("SuperconductingQubit", {"companies": new_companies})
 
-    def add_individual_company(self, company_data: Dict):
-        """Add a single company to the ontology"""
-        if not self.ontology:
-            self.load_or_create_ontology()
-
-        # Determine company type and create appropriate object
-        company_type = company_data.get('company_type', 'hardware')
-
-        if company_type == 'hardware':
-            company = HardwareCompany(**company_data)
-        elif company_type == 'supplier':
-            company = ComponentSupplier(**company_data)
-        elif company_type == 'software':
-            company = SoftwareCompany(**company_data)
-
-        # Add to data manager
-        self.data_manager.add_company(company)
-
-        # Add to ontology
-        modalities = company_data.get('modalities', ['SuperconductingQubit'])
-        for modality in modalities:
-            self.ontology.add_new_modality_data(modality, [company_data])
+    def add_individual_companies(self, companies: List[Dict]):
+        """Add a batch of companies with a single save at the end.
 
-        # Save updates
+        Companies are grouped by modality so the ontology is touched
+        once per modality and serialized once per batch, instead of a
+        full save per company.
+        """
+        self._ensure_built()
+
+        records = []
+        by_modality = defaultdict(list)
+        for company_data in companies:
+            # Dispatch on company type and keep only constructor fields
+            company_type = company_data.get('company_type', 'hardware')
+            try:
+                cls, allowed = _COMPANY_TYPES[company_type]
+            except KeyError:
+                raise ValueError(f"Unknown company type: {company_type}") from None
+
+            company = cls(**{k: company_data[k] for k in allowed & company_data.keys()})
+            records.append(company)
+            for modality in company_data.get('modalities', ['SuperconductingQubit']):
+                by_modality[modality].append(company_data)
+
+        # Add to data manager in one batch (one save)
+        self.data_manager.add_companies(records)
+
+        # One ontology update per modality, one save per batch
+        for modality, group in by_modality.items():
+            self.ontology.add_new_modality_data(modality, group)
         self.ontology.save_ontology()
+        self._version += 1
+        logging.info(f"✅ Added {len(records)} companies")
+
+    def add_individual_company(self, company_data: Dict):
+        """Add a single company to the ontology"""
+        self.add_individual_companies([company_data])
         logging.info(f"✅ Added company: {company_data.get('name')}")
 
     def query_supply_chain(self, query_type: str, **kwargs) -> List[Dict]:
@@ -109,7 +232,7 @@ class OntologyManager:
         elif query_type == 'companies_by_modality':
             modality = kwargs.get('modality')
             if isinstance(modality, str):
-                modality = QuantumModality(modality)
+                modality = _to_modality(modality)
             return self.data_manager.get_companies_by_modality(modality)
 
         elif query_type == 'all_companies':
@@ -121,11 +244,10 @@ class OntologyManager:
     def export_modality_data(self, modality: str, output_file: str):
         """Export data for specific modality to JSON file"""
         try:
-            modality_enum = QuantumModality(modality)
+            modality_enum = _to_modality(modality)
             data = self.data_manager.export_for_ontology(modality_enum)
 
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            _write_json(output_file, data, default=str)
 
             logging.info(f"✅ Exported {modality} data to {output_file}")
         except Exception as e:
@@ -133,38 +255,47 @@ class OntologyManager:
 
     def get_ontology_stats(self) -> Dict:
         """Get statistics about the current ontology"""
-        if not self.ontology:
-            self.load_or_create_ontology()
+        # Serve repeated polls from the cache until something mutates
+        if self._stats_cache[0] == self._version:
+            return self._stats_cache[1]
+
+        # Graph statistics need the built graph; data stats alone do not,
+        # but the build runs at most once thanks to _ensure_built
+        self._ensure_built()
 
         ontology_stats = self.ontology.get_statistics()
+        # One dict load; () default avoids allocating a throwaway list
+        data = self.data_manager.data
         data_stats = {
-            'companies_in_data': len(self.data_manager.data.get('companies', [])),
-            'partnerships': len(self.data_manager.data.get('partnerships', [])),
-            'products': len(self.data_manager.data.get('products', []))
+            'companies_in_data': len(data.get('companies') or ()),
+            'partnerships': len(data.get('partnerships') or ()),
+            'products': len(data.get('products') or ())
         }
 
-        return {**ontology_stats, **data_stats}
+        stats = {**ontology_stats, **data_stats}
+        self._stats_cache = (self._version, stats)
+        return stats
 
     def validate_and_clean_data(self):
         """Validate and clean the data"""
         companies = self.data_manager.data.get('companies', [])
         cleaned = 0
 
-        for company in companies:
-            # Clean empty fields
-            for key in list(company.keys()):
-                if company[key] in [None, '', 'nan', 'NaN']:
-                    del company[key]
-                    cleaned += 1
+        for i, company in enumerate(companies):
+            # Rebuild each record in one comprehension instead of
+            # deleting keys in place (each del pays dict bookkeeping)
+            kept = {k: v for k, v in company.items()
+                    if v is not None and (type(v) is not str or v not in _SENTINEL_STRS)}
+            cleaned += len(company) - len(kept)
 
             # Ensure required fields
-            if 'name' not in company:
-                company['name'] = 'Unknown Company'
-            if 'company_type' not in company:
-                company['company_type'] = 'hardware'
+            kept.setdefault('name', 'Unknown Company')
+            kept.setdefault('company_type', 'hardware')
+            companies[i] = kept
 
         if cleaned > 0:
             self.data_manager.save_data()
+            self._version += 1
             logging.info(f"✅ Cleaned {cleaned} empty fields")
 
     def create_modality_template(self, modality: str, output_file: str):
@@ -197,15 +328,15 @@ class OntologyManager:
             ]
         }
 
-        with open(output_file, 'w') as f:
-            json.dump(template, f, indent=2)
+        _write_json(output_file, template)
 
         print(f"✅ Template created: {output_file}")
         print("Edit the template file and use:")
         print(f"  manager.add_modality_companies('{modality}', '{output_file}')")
 
-def main():
-    """Main function for command-line usage"""
+@lru_cache(maxsize=1)
+def _build_parser():
+    """CLI argument parser, built once per process"""
     import argparse
 
     parser = argparse.ArgumentParser(description="Quantum Supply Chain Ontology Manager")
@@ -219,7 +350,11 @@ def main():
     parser.add_argument("--company-name", help="Company name")
     parser.add_argument("--company-type", choices=['hardware', 'supplier', 'software'], help="Company type")
 
-    args = parser.parse_args()
+    return parser
+
+def main():
+    """Main function for command-line usage"""
+    args = _build_parser().parse_args()
 
     manager = OntologyManager()
 